@@ -11,16 +11,32 @@ from pyinter.interval import (
     set_intersection,
     invert,
     difference,
+    iter_union,
+    iter_intersection,
+    iter_difference,
+    coverage,
+    at_least,
 )
 from pyinter.interval_set import IntervalSet
+from pyinter.compact_interval_set import CompactIntervalSet
+from pyinter.interval_index import IntervalIndex
+from pyinter.lazy import LazyIntervalSet
 
 __all__ = [
     'Bound',
     'Interval',
     'IntervalSet',
+    'CompactIntervalSet',
+    'IntervalIndex',
+    'LazyIntervalSet',
     'union',
     'intersection',
     'set_intersection',
     'invert',
     'difference',
+    'iter_union',
+    'iter_intersection',
+    'iter_difference',
+    'coverage',
+    'at_least',
 ]
@@ -0,0 +1,14 @@
+import sys
+
+PY2 = sys.version_info[0] == 2
+
+if PY2:
+    text_type = unicode  # noqa: F821
+
+    def to_str(text):
+        return text.encode('utf-8')
+else:
+    text_type = str
+
+    def to_str(text):
+        return text
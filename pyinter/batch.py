@@ -0,0 +1,66 @@
+"""
+Pairwise operations for many independent pairs of intervals.
+
+Results are calculated by comparing the bounds of both intervals directly,
+without sorting them or creating an IntervalSet for every pair.
+
+>>> lefts = [Interval.closed(0, 2), Interval.open(0, 1, 'a')]
+>>> rights = [Interval.open(1, 3, 'b'), Interval.closed(1, 2)]
+>>> intersect_pairs(lefts, rights)
+[<Interval (1, 2]: b>, None]
+>>> union_pairs(lefts, rights)
+[(<Interval [0, 1]>, <Interval (1, 3): b>),
+ (<Interval (0, 1): a>, <Interval [1, 2]>)]
+"""
+
+from .interval import Interval, _intersect_pair, _union_pair
+
+
+def intersect_pairs(lefts, rights, ignore_data=False):
+    """
+    Returns a list with the intersection of each pair of intervals
+    from lefts and rights, which is an Interval or None if they don't
+    overlap, see :func:`pyinter.intersection`.
+
+    >>> intersect_pairs(
+    ...     [Interval.closed(0, 2, 'a'), Interval.closed(4, 6)],
+    ...     [Interval.closed(1, 3, 'b'), Interval.open(3, 4)],
+    ... )
+    [<Interval [1, 2]: a, b>, None]
+    >>> intersect_pairs(
+    ...     [Interval.closed(0, 2, 'a')], [Interval.closed(1, 3, 'b')],
+    ...     ignore_data=True,
+    ... )
+    [<Interval [1, 2]>]
+    """
+
+    return [
+        _intersect_pair(left, right, ignore_data)
+        for left, right in zip(lefts, rights)
+    ]
+
+
+def union_pairs(lefts, rights, ignore_data=False):
+    """
+    Returns a list with the union of each pair of intervals from lefts
+    and rights, which is a tuple of sorted, non-overlapping intervals,
+    see :func:`pyinter.union`.
+
+    >>> union_pairs(
+    ...     [Interval.closed(0, 2), Interval.closed(4, 6)],
+    ...     [Interval.closed(1, 3), Interval.open(0, 1)],
+    ... )
+    [(<Interval [0, 3]>,), (<Interval (0, 1)>, <Interval [4, 6]>)]
+    >>> union_pairs([Interval.open(1, 5)], [Interval.open(2, 3, 'data')])
+    [(<Interval (1, 2]>, <Interval (2, 3): data>, <Interval [3, 5)>)]
+    >>> union_pairs(
+    ...     [Interval.open(1, 5)], [Interval.open(2, 3, 'data')],
+    ...     ignore_data=True,
+    ... )
+    [(<Interval (1, 5)>,)]
+    """
+
+    return [
+        tuple(_union_pair(left, right, ignore_data))
+        for left, right in zip(lefts, rights)
+    ]
@@ -0,0 +1,353 @@
+"""
+Benchmarks of the main operations, with reproducible (seeded) inputs.
+
+Run them with::
+
+    python -m pyinter.bench --output results.json
+
+and compare the results with an earlier run, which lists operations
+slower than the threshold and exits with status 1 if there are any::
+
+    python -m pyinter.bench --compare results.json
+
+Every scenario runs for each size, both with and without data attached
+to the intervals. Pass --sizes 10,100,1000,10000,100000,1000000 to cover
+the whole range (the largest sizes take a while), see --help for
+the other options.
+"""
+
+from __future__ import print_function
+
+import argparse
+import gc
+import json
+import math
+import platform
+import random
+import sys
+import timeit
+
+from .bound import Bound
+from .interval import Interval, union, invert
+from .interval_set import IntervalSet
+
+
+SIZES = (10, 1000, 100000)
+
+DATA = 'abcde'
+
+INTERVAL_TYPES = (
+    Interval.open,
+    Interval.closed,
+    Interval.open_closed,
+    Interval.closed_open,
+)
+
+
+def _intervals(rng, size, with_data):
+    """
+    Returns a list of size random, possibly overlapping intervals.
+    """
+
+    intervals = []
+    for _ in range(size):
+        lower = rng.randint(0, size * 10)
+        upper = lower + rng.randint(1, 20)
+        data = rng.choice(DATA) if with_data else None
+        intervals.append(rng.choice(INTERVAL_TYPES)(lower, upper, data))
+    return intervals
+
+
+def _union(rng, size, with_data):
+    intervals = _intervals(rng, size, with_data)
+    return lambda: union(*intervals)
+
+
+def _intersection(rng, size, with_data):
+    set_a = IntervalSet(_intervals(rng, size, with_data))
+    set_b = IntervalSet(_intervals(rng, size, with_data))
+    return lambda: set_a & set_b
+
+
+def _difference(rng, size, with_data):
+    set_a = IntervalSet(_intervals(rng, size, with_data))
+    set_b = IntervalSet(_intervals(rng, size, with_data))
+    return lambda: set_a - set_b
+
+
+def _invert(rng, size, with_data):
+    intervals = _intervals(rng, size, with_data)
+    return lambda: invert(*intervals)
+
+
+def _membership(rng, size, with_data):
+    interval_set = IntervalSet(_intervals(rng, size, with_data))
+    values = [rng.uniform(0, size * 10) for _ in range(size)]
+
+    def check():
+        for value in values:
+            value in interval_set
+
+    return check
+
+
+def _interval_membership(rng, size, with_data):
+    interval_set = IntervalSet(_intervals(rng, size, with_data))
+    intervals = [
+        Interval(Bound.ge(value), Bound.le(value + 1))
+        for value in (rng.uniform(0, size * 10) for _ in range(size))
+    ]
+
+    def check():
+        for interval in intervals:
+            interval in interval_set
+
+    return check
+
+
+def _construction(rng, size, with_data):
+    intervals = _intervals(rng, size, with_data)
+    return lambda: IntervalSet(intervals)
+
+
+# each scenario prepares its inputs and returns the function to measure
+SCENARIOS = {
+    'union': _union,
+    'intersection': _intersection,
+    'difference': _difference,
+    'invert': _invert,
+    'membership': _membership,
+    'interval_membership': _interval_membership,
+    'construction': _construction,
+}
+
+
+def statistics(times):
+    """
+    Returns a dictionary of statistics of the measured times.
+
+    >>> result = statistics([3.0, 1.0, 2.0])
+    >>> [(key, result[key]) for key in sorted(result)]
+    [('max', 3.0), ('mean', 2.0), ('median', 2.0), ('min', 1.0),
+     ('stdev', 1.0)]
+    """
+
+    times = sorted(times)
+    count = len(times)
+    mean = sum(times) / count
+
+    if count % 2:
+        median = times[count // 2]
+    else:
+        median = (times[count // 2 - 1] + times[count // 2]) / 2
+
+    stdev = 0.0
+    if count > 1:
+        stdev = math.sqrt(
+            sum((time - mean) ** 2 for time in times) / (count - 1)
+        )
+
+    return {
+        'min': times[0],
+        'max': times[-1],
+        'mean': mean,
+        'median': median,
+        'stdev': stdev,
+    }
+
+
+def measure(scenario, size, with_data, repeat, seed):
+    """
+    Runs a single scenario repeat times and returns a dictionary
+    describing it, with statistics of the measured times (in seconds).
+    Garbage collection is disabled while measuring, like in timeit.
+    """
+
+    function = SCENARIOS[scenario](random.Random(seed), size, with_data)
+
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = timeit.default_timer()
+            function()
+            times.append(timeit.default_timer() - start)
+        finally:
+            gc.enable()
+
+    result = {
+        'scenario': scenario,
+        'size': size,
+        'data': with_data,
+        'times': times,
+    }
+    result.update(statistics(times))
+    return result
+
+
+def run(scenarios=None, sizes=SIZES, repeat=5, seed=0, log=None):
+    """
+    Runs the scenarios (all of them by default) for each of the sizes,
+    with and without data, and returns the report, which can be dumped
+    to JSON.
+
+    >>> report = run(['union', 'membership'], sizes=[10], repeat=2)
+    >>> [
+    ...     (result['scenario'], result['size'], result['data'])
+    ...     for result in report['results']
+    ... ]
+    [('union', 10, False), ('union', 10, True),
+     ('membership', 10, False), ('membership', 10, True)]
+    >>> len(report['results'][0]['times'])
+    2
+    """
+
+    if scenarios is None:
+        scenarios = sorted(SCENARIOS)
+
+    results = []
+    for scenario in scenarios:
+        for size in sizes:
+            for with_data in (False, True):
+                result = measure(scenario, size, with_data, repeat, seed)
+                results.append(result)
+
+                if log is not None:
+                    print(
+                        '{scenario:<20} {size:>8} {data!s:<5} '
+                        'median {median:.6f}s'.format(**result),
+                        file=log,
+                    )
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'seed': seed,
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def _key(result):
+    return result['scenario'], result['size'], result['data']
+
+
+def compare(report, baseline, threshold=1.2):
+    """
+    Compares median times of the results of two runs, returns a list
+    of (scenario, size, data, ratio) tuples for results slower than
+    the baseline by more than the threshold ratio.
+
+    >>> baseline = {'results': [
+    ...     {'scenario': 'union', 'size': 10, 'data': False, 'median': 1.0},
+    ...     {'scenario': 'union', 'size': 10, 'data': True, 'median': 1.0},
+    ... ]}
+    >>> report = {'results': [
+    ...     {'scenario': 'union', 'size': 10, 'data': False, 'median': 1.1},
+    ...     {'scenario': 'union', 'size': 10, 'data': True, 'median': 1.5},
+    ...     {'scenario': 'invert', 'size': 10, 'data': True, 'median': 9.0},
+    ... ]}
+    >>> compare(report, baseline)
+    [('union', 10, True, 1.5)]
+    """
+
+    baseline_medians = dict(
+        (_key(result), result['median']) for result in baseline['results']
+    )
+
+    regressions = []
+    for result in report['results']:
+        baseline_median = baseline_medians.get(_key(result))
+        if not baseline_median:
+            continue
+
+        ratio = result['median'] / baseline_median
+        if ratio > threshold:
+            regressions.append(_key(result) + (ratio, ))
+
+    return regressions
+
+
+def _parse_sizes(value):
+    return [int(size) for size in value.split(',')]
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m pyinter.bench',
+        description='Benchmarks pyinter operations.',
+    )
+    parser.add_argument(
+        'scenarios', nargs='*', metavar='scenario',
+        help='scenarios to run (default: all), one of: {}'.format(
+            ', '.join(sorted(SCENARIOS))
+        ),
+    )
+    parser.add_argument(
+        '--sizes', type=_parse_sizes, default=list(SIZES),
+        help='comma separated numbers of intervals (default: {})'.format(
+            ','.join(str(size) for size in SIZES)
+        ),
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='number of measurements of each scenario (default: 5)',
+    )
+    parser.add_argument(
+        '--seed', type=int, default=0,
+        help='seed of the random inputs (default: 0)',
+    )
+    parser.add_argument(
+        '--output', help='file to write the JSON report to (default: stdout)',
+    )
+    parser.add_argument(
+        '--compare', metavar='BASELINE',
+        help='JSON report of an earlier run to compare the results with',
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=1.2,
+        help='ratio of median times reported as a regression (default: 1.2)',
+    )
+    options = parser.parse_args(args)
+
+    for scenario in options.scenarios:
+        if scenario not in SCENARIOS:
+            parser.error('unknown scenario: {}'.format(scenario))
+
+    report = run(
+        options.scenarios or None,
+        sizes=options.sizes,
+        repeat=options.repeat,
+        seed=options.seed,
+        log=sys.stderr,
+    )
+
+    if options.output:
+        with open(options.output, 'w') as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+    else:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if options.compare:
+        with open(options.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+
+        regressions = compare(report, baseline, options.threshold)
+        for scenario, size, with_data, ratio in regressions:
+            print(
+                'regression: {} size={} data={} {:.2f}x slower'.format(
+                    scenario, size, with_data, ratio
+                ),
+                file=sys.stderr,
+            )
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,54 @@
 import operator
 
+from ._compat import to_str
 from .extrema import NEGATIVE_INFINITY, INFINITY
 
 
+class _Kind(object):
+    """
+    Metadata shared by all bounds with the same operator.
+    """
+
+    __slots__ = ('operator', 'order', 'is_lower', 'prefix', 'suffix',
+                 'opposite')
+
+    def __init__(self, operator, order, prefix, suffix):
+        self.operator = operator
+        self.order = order
+        # only lower bounds are written before their values
+        self.is_lower = bool(prefix)
+        self.prefix = prefix
+        self.suffix = suffix
+        self.opposite = None
+
+
+# logical order of operators
+# ...)[value](...
+_LT = _Kind(operator.lt, -2, '', ')')
+_GE = _Kind(operator.ge, -1, '[', '')
+_LE = _Kind(operator.le, +1, '', ']')
+_GT = _Kind(operator.gt, +2, '(', '')
+
+_LT.opposite, _GE.opposite = _GE, _LT
+_LE.opposite, _GT.opposite = _GT, _LE
+
+_KINDS = dict((kind.operator, kind) for kind in (_LT, _GE, _LE, _GT))
+
+
+def _create(cls, value, kind):
+    """
+    Creates a bound of a known kind, skipping the operator lookup.
+    """
+
+    bound = object.__new__(cls)
+    bound._value = value
+    bound._kind = kind
+    bound._order = kind.order
+    bound._key = (value, kind.order)
+    bound._is_lower = kind.is_lower
+    return bound
+
+
 class Bound(object):
     """
     Represents a single interval (lower or upper) bound.
@@ -16,66 +62,77 @@ class Bound(object):
 
     >>> [value in Bound(15, operator.le) for value in (14, 15, 16)]
     [True, True, False]
+
+    Bounds are immutable and keep a precomputed (value, order) sort key,
+    which is used for all comparisons, and a reference to the metadata
+    of their operator (its order, the opposite operator etc.),
+    which is shared by all bounds with the same operator.
+
+    >>> Bound.ge(15)._key
+    (15, -1)
+    >>> Bound.ge(15)._kind is Bound(16, operator.ge)._kind
+    True
+
+    The infinite bounds are shared:
+
+    >>> Bound.gt_ninf() is Bound.gt_ninf()
+    True
     """
 
-    OPPOSITE_OPERATORS = {
-        operator.lt: operator.ge,
-        operator.le: operator.gt,
-        operator.ge: operator.lt,
-        operator.gt: operator.le,
-    }
-
-    # logical order of operators
-    # ...)[value](...
-    OPERATOR_ORDER = {
-        operator.lt: -2,  # )
-        operator.ge: -1,  # [
-        operator.le: +1,  # ]
-        operator.gt: +2,  # (
-    }
-
-    PREFIXES_SUFFIXES = {
-        operator.lt: ('', ')'),
-        operator.le: ('', ']'),
-        operator.ge: ('[', ''),
-        operator.gt: ('(', ''),
-    }
-
-    _value = None
-    _operator = None
+    __slots__ = ('_value', '_kind', '_order', '_key', '_is_lower')
+
+    OPPOSITE_OPERATORS = dict(
+        (kind.operator, kind.opposite.operator) for kind in _KINDS.values()
+    )
+
+    OPERATOR_ORDER = dict(
+        (kind.operator, kind.order) for kind in _KINDS.values()
+    )
+
+    PREFIXES_SUFFIXES = dict(
+        (kind.operator, (kind.prefix, kind.suffix))
+        for kind in _KINDS.values()
+    )
 
     @classmethod
     def lt(cls, value):
         """Shortcut method for Bound(value, operator.lt)"""
-        return cls(value, operator.lt)
+        return _create(cls, value, _LT)
 
     @classmethod
     def le(cls, value):
         """Shortcut method for Bound(value, operator.le)"""
-        return cls(value, operator.le)
+        return _create(cls, value, _LE)
 
     @classmethod
     def ge(cls, value):
         """Shortcut method for Bound(value, operator.ge)"""
-        return cls(value, operator.ge)
+        return _create(cls, value, _GE)
 
     @classmethod
     def gt(cls, value):
         """Shortcut method for Bound(value, operator.gt)"""
-        return cls(value, operator.gt)
+        return _create(cls, value, _GT)
 
     @classmethod
     def lt_inf(cls):
-        return cls(INFINITY, operator.lt)
+        if cls is Bound:
+            return _LT_INF
+        return _create(cls, INFINITY, _LT)
 
     @classmethod
     def gt_ninf(cls):
-        return cls(NEGATIVE_INFINITY, operator.gt)
+        if cls is Bound:
+            return _GT_NINF
+        return _create(cls, NEGATIVE_INFINITY, _GT)
 
     def __init__(self, value, operator):
+        kind = _KINDS[operator]
         self._value = value
-        self._operator = operator
-        self._order = self.OPERATOR_ORDER[operator]
+        self._kind = kind
+        self._order = kind.order
+        self._key = (value, kind.order)
+        self._is_lower = kind.is_lower
 
     @property
     def value(self):
@@ -83,17 +140,17 @@ class Bound(object):
 
     @property
     def operator(self):
-        return self._operator
+        return self._kind.operator
 
     def is_opposite_of(self, other):
         return (
-            self.value == other.value
-            and other.operator == self.OPPOSITE_OPERATORS[self.operator]
+            other._kind is self._kind.opposite
+            and self._value == other._value
         )
 
     @property
     def is_lower(self):
-        return self.operator in (operator.gt, operator.ge)
+        return self._is_lower
 
     def __contains__(self, value):
         """
@@ -112,9 +169,9 @@ class Bound(object):
         [False, False, True]
         """
 
-        return self._operator(value, self._value)
+        return self._kind.operator(value, self._value)
 
-    def __cmp__(self, other):
+    def __eq__(self, other):
         """
         Compares bounds based on the logical order they would appear.
         If the value is the same, the ordering is as follows:
@@ -126,28 +183,73 @@ class Bound(object):
         True
         >>> Bound.gt(6) < Bound.lt(7)
         True
+        >>> Bound.le(6) <= Bound.le(6) and Bound.le(6) >= Bound.le(6)
+        True
+        >>> Bound.gt(6) > Bound.le(6) and not Bound.gt(6) <= Bound.le(6)
+        True
         >>> [Bound(5, op) == Bound(5, op)
         ...  for op in (operator.lt, operator.gt, operator.le, operator.ge)]
         [True, True, True, True]
+        >>> Bound.lt(5) != Bound.le(5)
+        True
+        >>> Bound.lt(5) == 5
+        False
+        >>> sorted([Bound.lt_inf(), Bound.gt(1), Bound.gt_ninf(), Bound.lt(1)])
+        [<Bound (-inf>, <Bound 1)>, <Bound (1>, <Bound inf)>]
+
+        Ordering other types is left to them (and fails on Python 3):
+
+        >>> Bound.le(1).__lt__(3) is NotImplemented
+        True
         """
-        return cmp(self.value, other.value) or cmp(self._order, other._order)
+        if not isinstance(other, Bound):
+            return NotImplemented
+        return self._key == other._key
+
+    def __ne__(self, other):
+        if not isinstance(other, Bound):
+            return NotImplemented
+        return self._key != other._key
+
+    def __lt__(self, other):
+        if not isinstance(other, Bound):
+            return NotImplemented
+        return self._key < other._key
+
+    def __le__(self, other):
+        if not isinstance(other, Bound):
+            return NotImplemented
+        return self._key <= other._key
+
+    def __gt__(self, other):
+        if not isinstance(other, Bound):
+            return NotImplemented
+        return self._key > other._key
+
+    def __ge__(self, other):
+        if not isinstance(other, Bound):
+            return NotImplemented
+        return self._key >= other._key
 
     def __repr__(self):
         return '<{} {}>'.format(self.__class__.__name__, str(self))
 
     def __unicode__(self):
-        prefix, suffix = self.PREFIXES_SUFFIXES[self._operator]
-        return u'{}{}{}'.format(prefix, self._value, suffix)
+        kind = self._kind
+        return u'{}{}{}'.format(kind.prefix, self._value, kind.suffix)
 
     def __hash__(self):
         """
         >>> sorted(set([Bound.gt(5), Bound.gt(5), Bound.ge(5)]))
         [<Bound [5>, <Bound (5>]
         """
-        return hash((self.value, self._order))
+        return hash(self._key)
+
+    def __reduce__(self):
+        return (self.__class__, (self._value, self._kind.operator))
 
     def __str__(self):
-        return unicode(self).encode('utf-8')
+        return to_str(self.__unicode__())
 
     def __invert__(self):
         """
@@ -160,7 +262,9 @@ class Bound(object):
         True
         """
 
-        return self.__class__(
-            self._value,
-            self.OPPOSITE_OPERATORS[self._operator]
-        )
+        return _create(self.__class__, self._value, self._kind.opposite)
+
+
+# returned by Bound.lt_inf() and Bound.gt_ninf()
+_LT_INF = _create(Bound, INFINITY, _LT)
+_GT_NINF = _create(Bound, NEGATIVE_INFINITY, _GT)
@@ -0,0 +1,347 @@
+import numbers
+import operator
+from array import array
+from bisect import bisect_right
+
+from ._compat import PY2, text_type, to_str
+from .bound import Bound
+from .extrema import INFINITY, NEGATIVE_INFINITY
+from .interval import Interval, union, set_intersection, difference
+
+
+LOWER_CLOSED = 1
+UPPER_CLOSED = 2
+
+# 64-bit integers, Python 2 arrays don't support the 'q' typecode,
+# but 'l' has 64 bits on its 64-bit POSIX builds
+INTEGER_TYPECODE = 'l' if PY2 else 'q'
+MAX_INTEGER = 2 ** (8 * array(INTEGER_TYPECODE).itemsize - 1) - 1
+MIN_INTEGER = -MAX_INTEGER - 1
+
+
+def _to_number(value):
+    if value is INFINITY:
+        return float('inf')
+    if value is NEGATIVE_INFINITY:
+        return float('-inf')
+    if isinstance(value, numbers.Real):
+        return value
+
+    raise TypeError(
+        'CompactIntervalSet only supports numeric bounds, got {!r}'
+        .format(value)
+    )
+
+
+def _from_number(value):
+    if value == float('inf'):
+        return INFINITY
+    if value == float('-inf'):
+        return NEGATIVE_INFINITY
+    return value
+
+
+def _is_integer(value):
+    return (
+        isinstance(value, numbers.Integral)
+        and MIN_INTEGER <= value <= MAX_INTEGER
+    )
+
+
+def _to_array(typecode, values):
+    """
+    Returns an array of the values, raising a ValueError if any
+    of them would be changed by storing it, eg. integers which don't
+    fit in the typecode or aren't exact floats.
+    """
+
+    try:
+        stored = array(typecode, values)
+    except OverflowError:
+        stored = None
+
+    for index, value in enumerate(values):
+        if stored is None or stored[index] != value:
+            raise ValueError(
+                'CompactIntervalSet can\'t store {!r} exactly in a {!r} array'
+                .format(_from_number(value), typecode)
+            )
+
+    return stored
+
+
+def _join_adjacent(intervals):
+    """
+    Joins adjacent intervals in a sorted list of non-overlapping ones
+    (eg. pieces of an intersection with data), so that each value
+    is in the interval with the last lower bound before it.
+
+    >>> _join_adjacent([
+    ...     Interval.closed(0, 2), Interval.open(2, 5), Interval.closed(6, 7),
+    ... ])
+    [<Interval [0, 5)>, <Interval [6, 7]>]
+    """
+
+    joined = []
+    for interval in intervals:
+        if joined and joined[-1].upper.is_opposite_of(interval.lower):
+            joined[-1] = Interval(joined[-1].lower, interval.upper)
+        else:
+            joined.append(interval)
+    return joined
+
+
+class CompactIntervalSet(object):
+    """
+    A memory efficient alternative to the IntervalSet for intervals with
+    numeric bounds. Bounds are kept in parallel arrays and Interval objects
+    are only created when iterating over the set.
+    Data attached to the intervals is not stored.
+
+    >>> intervals = (
+    ...     Interval.closed(2, 3),
+    ...     Interval.open(1, 2),
+    ...     Interval.closed(5, 6, 'data'),
+    ... )
+
+    >>> CompactIntervalSet(intervals)
+    <CompactIntervalSet (1, 3], [5, 6]>
+
+    Bounds which are 64-bit integers are stored in an INTEGER_TYPECODE
+    array, anything else uses floats (including infinities):
+
+    >>> CompactIntervalSet(intervals).typecode == INTEGER_TYPECODE
+    True
+    >>> CompactIntervalSet([Interval.closed(1.5, 2)]).typecode
+    'd'
+    >>> CompactIntervalSet([Interval(Bound.ge(0), Bound.lt_inf())])
+    <CompactIntervalSet [0.0, inf)>
+
+    Bounds which would change when stored are rejected:
+
+    >>> CompactIntervalSet([Interval.closed(0, 2 ** 64 + 1)])
+    Traceback (most recent call last):
+    ...
+    ValueError: CompactIntervalSet can't store 18446744073709551617
+    exactly in a 'd' array
+    >>> from fractions import Fraction
+    >>> CompactIntervalSet([Interval.closed(0, Fraction(1, 3))])
+    Traceback (most recent call last):
+    ...
+    ValueError: CompactIntervalSet can't store Fraction(1, 3)
+    exactly in a 'd' array
+    >>> CompactIntervalSet([Interval.closed(0, 0.1)], typecode='f')
+    Traceback (most recent call last):
+    ...
+    ValueError: CompactIntervalSet can't store 0.1 exactly in a 'f' array
+
+    >>> CompactIntervalSet([Interval.closed('a', 'b')])
+    Traceback (most recent call last):
+    ...
+    TypeError: CompactIntervalSet only supports numeric bounds, got 'a'
+    """
+
+    def __init__(self, iterable=None, check_overlaps=True, typecode=None):
+        intervals = list(iterable) if iterable else []
+
+        if check_overlaps:
+            intervals = union(*intervals, ignore_data=True)
+        else:
+            intervals.sort()
+            intervals = _join_adjacent(intervals)
+
+        values = []
+        for interval in intervals:
+            values.append(_to_number(interval.lower.value))
+            values.append(_to_number(interval.upper.value))
+
+        if typecode is None:
+            typecode = 'd'
+            if all(_is_integer(value) for value in values):
+                typecode = INTEGER_TYPECODE
+
+        self._lowers = _to_array(typecode, values[0::2])
+        self._uppers = _to_array(typecode, values[1::2])
+        self._flags = array('B', (
+            (LOWER_CLOSED if interval.lower.operator is operator.ge else 0)
+            | (UPPER_CLOSED if interval.upper.operator is operator.le else 0)
+            for interval in intervals
+        ))
+
+    @property
+    def typecode(self):
+        return self._lowers.typecode
+
+    def _interval(self, index):
+        flags = self._flags[index]
+        lower = _from_number(self._lowers[index])
+        upper = _from_number(self._uppers[index])
+
+        return Interval(
+            Bound.ge(lower) if flags & LOWER_CLOSED else Bound.gt(lower),
+            Bound.le(upper) if flags & UPPER_CLOSED else Bound.lt(upper),
+        )
+
+    def _contains_value(self, index, value):
+        flags = self._flags[index]
+        lower = self._lowers[index]
+        upper = self._uppers[index]
+
+        return (
+            (lower < value or (flags & LOWER_CLOSED and lower == value))
+            and (value < upper or (flags & UPPER_CLOSED and value == upper))
+        )
+
+    def __len__(self):
+        return len(self._flags)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._interval(index)
+
+    def __contains__(self, item):
+        """
+        Checks whether the value or interval is inside any of the intervals
+        in the set.
+
+        >>> set = CompactIntervalSet([
+        ...     Interval.open(0, 2),
+        ...     Interval.closed(3, 4),
+        ... ])
+        >>> [i in set for i in range(6)]
+        [False, True, False, True, True, False]
+        >>> 0.5 in set
+        True
+
+        >>> Interval.open(1, 2) in set
+        True
+        >>> Interval.closed(3, 3) in set
+        True
+        >>> Interval.closed(2, 3) in set
+        False
+        """
+
+        if isinstance(item, Interval):
+            value = _to_number(item.lower.value)
+        else:
+            value = item
+
+        index = bisect_right(self._lowers, value) - 1
+        if index < 0:
+            return False
+
+        if isinstance(item, Interval):
+            return item in self._interval(index)
+
+        return self._contains_value(index, value)
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, str(self))
+
+    def __unicode__(self):
+        return u', '.join(text_type(interval) for interval in self)
+
+    def __str__(self):
+        return to_str(self.__unicode__())
+
+    def __eq__(self, other):
+        if isinstance(other, CompactIntervalSet):
+            return (
+                self._lowers == other._lowers
+                and self._uppers == other._uppers
+                and self._flags == other._flags
+            )
+        return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __add__(self, other):
+        return self.union(other)
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    def _iter_other_sets(self, others):
+        for other in others:
+            yield (other, ) if isinstance(other, Interval) else other
+
+    def _iter_other_intervals(self, others):
+        for other in self._iter_other_sets(others):
+            for interval in other:
+                yield interval
+
+    def union(self, *others):
+        """
+        Returns the union of this set and other sets and/or intervals.
+
+        >>> set_a = CompactIntervalSet([
+        ...     Interval.open(1, 3), Interval.closed(4, 5),
+        ... ])
+        >>> set_b = Interval.closed(0, 2) | Interval.open(3, 5, 'data')
+        >>> set_a | set_b
+        <CompactIntervalSet [0, 3), (3, 5]>
+        >>> set_a | Interval.closed(3, 4)
+        <CompactIntervalSet (1, 5]>
+        >>> set_a | Interval.closed(5, 5.5)
+        <CompactIntervalSet (1.0, 3.0), [4.0, 5.5]>
+        """
+
+        intervals = list(self)
+        intervals.extend(self._iter_other_intervals(others))
+        return self.__class__(intervals)
+
+    def intersection(self, *others):
+        """
+        Returns the intersection of this set and other sets and/or intervals.
+
+        >>> set_a = CompactIntervalSet([
+        ...     Interval.open(1, 3), Interval.closed(4, 5),
+        ... ])
+        >>> set_b = Interval.closed(0, 2) | Interval.open(3, 5, 'data')
+        >>> set_a & set_b
+        <CompactIntervalSet (1, 2], [4, 5)>
+        >>> set_a & Interval.open(5, 6)
+        <CompactIntervalSet >
+
+        Pieces of the result, which are adjacent, are joined:
+
+        >>> result = CompactIntervalSet([Interval.closed(0, 9)]) & (
+        ...     Interval.closed(0, 2) | Interval.open(2, 5, 'data')
+        ... )
+        >>> result
+        <CompactIntervalSet [0, 5)>
+        >>> [value in result for value in (1, 2, 3, 5)]
+        [True, True, True, False]
+        """
+
+        result = set_intersection(
+            list(self),
+            *self._iter_other_sets(others),
+            ignore_data=True
+        )
+        return self.__class__(result, check_overlaps=False)
+
+    def difference(self, *others):
+        """
+        Returns the intervals of this set, which are not in any of the other
+        sets and/or intervals.
+
+        >>> set_a = CompactIntervalSet([
+        ...     Interval.closed(0, 2), Interval.open(3, 5),
+        ... ])
+        >>> set_b = Interval.open(1, 3, 'some') | Interval.closed(4, 5)
+        >>> set_a - set_b
+        <CompactIntervalSet [0, 1], (3, 4)>
+        >>> set_a - set_a
+        <CompactIntervalSet >
+        """
+
+        result = difference(list(self), self._iter_other_intervals(others))
+        return self.__class__(result, check_overlaps=False)
@@ -0,0 +1,401 @@
+"""
+Interval sets kept on disk, for collections which don't fit in memory.
+
+A :class:`DiskIntervalSet` is a file in the format of
+:mod:`pyinter.serialization`, memory mapped and queried in place: membership
+checks and range queries bisect the sorted bound columns and only create
+Interval objects for the intervals they return. New sets are written
+by streaming sorted intervals, one chunk of columns at a time, and set
+operations with in-memory sets merge both sides into a new file the same
+way, so neither the stored nor the resulting intervals are ever loaded
+at once (only the table of distinct data sets is kept in memory).
+
+>>> import os, tempfile
+>>> directory = tempfile.mkdtemp()
+>>> path = os.path.join(directory, 'base')
+>>> disk_set = DiskIntervalSet.create(
+...     path, (Interval.closed(value, value + 2) for value in range(0, 30, 5))
+... )
+>>> len(disk_set), 7 in disk_set, 8 in disk_set
+(6, True, False)
+>>> list(disk_set.overlapping(Interval.closed(12, 21)))
+[<Interval [10, 12]>, <Interval [15, 17]>, <Interval [20, 22]>]
+
+>>> other = IntervalSet([Interval.closed(1, 11), Interval.closed(24, 30)])
+>>> union_set = disk_set.union(other, os.path.join(directory, 'union'))
+>>> list(union_set)
+[<Interval [0, 12]>, <Interval [15, 17]>, <Interval [20, 22]>,
+ <Interval [24, 30]>]
+>>> difference_set = disk_set.difference(
+...     other, os.path.join(directory, 'difference')
+... )
+>>> list(difference_set)
+[<Interval [0, 1)>, <Interval (11, 12]>, <Interval [15, 17]>,
+ <Interval [20, 22]>]
+
+>>> for interval_set in (disk_set, union_set, difference_set):
+...     interval_set.close()
+...     os.remove(interval_set.path)
+>>> os.rmdir(directory)
+"""
+
+import heapq
+import itertools
+import os
+import shutil
+import struct
+import tempfile
+import uuid
+from bisect import bisect_left
+
+from .interval import (
+    Interval, iter_union, iter_intersection, iter_difference,
+)
+from .interval_set import IntervalSet
+from .serialization import (
+    CODECS,
+    DATA_INDEX,
+    HEADER,
+    INTEGER,
+    LOWER_INFINITE,
+    MAGIC,
+    UPPER_INFINITE,
+    VERSION,
+    MappedIntervalSet,
+    _DataTable,
+    _common_type,
+    _encode_interval,
+    _finite,
+    _value_type,
+)
+
+
+# number of intervals buffered before they are packed and written
+CHUNK_SIZE = 65536
+
+# replaces existing files on Windows as well, os.rename only does on POSIX
+_replace = getattr(os, 'replace', os.rename)
+
+
+def _finite_values(interval):
+    return [
+        value for value in (interval.lower.value, interval.upper.value)
+        if _finite(value)
+    ]
+
+
+def _peek_value_type(intervals):
+    """
+    Returns the type of the first finite bound value of an iterator
+    of intervals (INTEGER if there are none) and an iterator over all
+    of the intervals, including the ones consumed to find it.
+    """
+
+    consumed = []
+    for interval in intervals:
+        consumed.append(interval)
+        values = _finite_values(interval)
+        if values:
+            return _value_type(values), itertools.chain(consumed, intervals)
+
+    return INTEGER, iter(consumed)
+
+
+class _Writer(object):
+    """
+    Writes sorted, non-overlapping intervals to a file in chunks.
+    Each column is written to a temporary file first, they are joined
+    when the writer is saved, once the number of intervals is known.
+    """
+
+    def __init__(self, path, value_type):
+        self._path = path
+        self._value_type = value_type
+        self._codec = CODECS[value_type]
+        self._count = 0
+        self._data_table = _DataTable()
+        self._files = [tempfile.TemporaryFile() for _ in range(4)]
+        self._chunk = ([], [], bytearray(), [])
+
+    def write(self, interval):
+        values = _finite_values(interval)
+        if values and _common_type(
+            set((self._value_type, _value_type(values)))
+        ) != self._value_type:
+            raise TypeError(
+                'Bound values of {} can\'t be stored with the previous ones'
+                .format(interval)
+            )
+
+        lowers, uppers, flags, data_indexes = self._chunk
+        interval_flags, lower, upper = _encode_interval(interval, self._codec)
+        lowers.append(lower)
+        uppers.append(upper)
+        flags.append(interval_flags)
+        data_indexes.append(self._data_table.index(interval.data))
+
+        if len(lowers) >= CHUNK_SIZE:
+            self._flush()
+
+    def _flush(self):
+        lowers, uppers, flags, data_indexes = self._chunk
+        count = len(lowers)
+        column_format = '<{}{}'.format(count, self._codec.format)
+
+        lowers_file, uppers_file, flags_file, data_indexes_file = self._files
+        lowers_file.write(struct.pack(column_format, *lowers))
+        uppers_file.write(struct.pack(column_format, *uppers))
+        flags_file.write(bytes(flags))
+        data_indexes_file.write(
+            struct.pack('<{}{}'.format(count, DATA_INDEX), *data_indexes)
+        )
+
+        self._count += count
+        self._chunk = ([], [], bytearray(), [])
+
+    def save(self):
+        """
+        Joins the columns into a temporary file next to the path
+        and moves it to the path, so that a file is only replaced
+        by a complete set.
+        """
+
+        self._flush()
+        data_bytes = self._data_table.dumps()
+
+        temporary_path = '{}.{}.tmp'.format(self._path, uuid.uuid4().hex)
+        handle = os.open(
+            temporary_path,
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0),
+            0o666,
+        )
+
+        try:
+            with os.fdopen(handle, 'wb') as output:
+                output.write(HEADER.pack(
+                    MAGIC, VERSION, self._value_type, self._count,
+                    len(data_bytes),
+                ))
+                for column_file in self._files:
+                    column_file.seek(0)
+                    shutil.copyfileobj(column_file, output)
+                output.write(data_bytes)
+
+            _replace(temporary_path, self._path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def close(self):
+        for column_file in self._files:
+            column_file.close()
+
+
+def _write(path, intervals, value_type=None):
+    """
+    Streams sorted, non-overlapping intervals to a file. Without
+    a value_type, it's taken from the first finite bound value.
+    Nothing is written if the intervals can't be stored.
+    """
+
+    intervals = iter(intervals)
+    if value_type is None:
+        value_type, intervals = _peek_value_type(intervals)
+
+    writer = _Writer(path, value_type)
+    try:
+        for interval in intervals:
+            writer.write(interval)
+        writer.save()
+    finally:
+        writer.close()
+
+
+class DiskIntervalSet(MappedIntervalSet):
+    """
+    A read-only, memory mapped interval set stored in a file written
+    by :meth:`create`, :func:`pyinter.serialization.dump` or one of
+    the set operations, which write their results to new files.
+
+    >>> import os, tempfile
+    >>> directory = tempfile.mkdtemp()
+    >>> path = os.path.join(directory, 'base')
+    >>> with DiskIntervalSet.create(path, [
+    ...     Interval.closed(0, 2, 'a'), Interval.closed(1, 3, 'b'),
+    ...     Interval.open(5, 6),
+    ... ]) as disk_set:
+    ...     list(disk_set)
+    [<Interval [0, 1): a>, <Interval [1, 2]: a, b>, <Interval (2, 3]: b>,
+     <Interval (5, 6)>]
+    >>> disk_set = DiskIntervalSet(path)
+    >>> with disk_set.intersection(
+    ...     [Interval.closed(2.5, 5.5)], os.path.join(directory, 'result')
+    ... ) as result:
+    ...     list(result)
+    [<Interval [2.5, 3.0]: b>, <Interval (5.0, 5.5]>]
+    >>> disk_set.union([], path)
+    Traceback (most recent call last):
+    ...
+    ValueError: The result can't be written to the file of the set
+
+    If the intervals can't be written, an existing file is left as it is:
+
+    >>> DiskIntervalSet.create(os.path.join(directory, 'result'), [
+    ...     Interval.closed(0, 1), Interval.closed(5, 6),
+    ...     Interval.closed(2, 3),
+    ... ])
+    Traceback (most recent call last):
+    ...
+    ValueError: intervals must be sorted by their lower bounds, ...
+    >>> DiskIntervalSet.create(os.path.join(directory, 'result'), [
+    ...     Interval.closed(0.5, 1), Interval.closed(2, 2 ** 53 + 1),
+    ... ])
+    Traceback (most recent call last):
+    ...
+    TypeError: Bound value 9007199254740993 can't be stored exactly
+    >>> with DiskIntervalSet(os.path.join(directory, 'result')) as result:
+    ...     list(result)
+    [<Interval [2.5, 3.0]: b>, <Interval (5.0, 5.5]>]
+    >>> sorted(os.listdir(directory))
+    ['base', 'result']
+    >>> disk_set.close()
+    >>> os.remove(path)
+    >>> os.remove(os.path.join(directory, 'result'))
+    >>> os.rmdir(directory)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        super(DiskIntervalSet, self).__init__(path)
+
+    @classmethod
+    def create(cls, path, intervals, value_type=None):
+        """
+        Writes intervals sorted by their lower bounds (eg. read from
+        another file) to a new file, joining them like an IntervalSet
+        if they overlap, and returns the set. Without a value_type
+        (one of the types in :mod:`pyinter.serialization`), it's taken
+        from the first finite bound value.
+        """
+
+        _write(path, iter_union(intervals), value_type)
+        return cls(path)
+
+    def _is_unbounded(self):
+        # a (-inf, inf) interval has no values to compare with
+        layout = self._layout
+        infinite = LOWER_INFINITE | UPPER_INFINITE
+        return layout.count and layout.flags[0] & infinite == infinite
+
+    def overlapping(self, interval):
+        """
+        Yields the stored intervals which overlap the given interval,
+        in order.
+
+        >>> import os, tempfile
+        >>> handle, path = tempfile.mkstemp()
+        >>> os.close(handle)
+        >>> disk_set = DiskIntervalSet.create(path, [
+        ...     Interval.closed(0, 1), Interval.open(2, 3),
+        ...     Interval.open(3, 4), Interval.closed(6, 7),
+        ... ])
+        >>> list(disk_set.overlapping(Interval.closed(1, 3)))
+        [<Interval [0, 1]>, <Interval (2, 3)>]
+        >>> list(disk_set.overlapping(Interval.closed_open(3, 6)))
+        [<Interval (3, 4)>]
+        >>> from pyinter import Bound
+        >>> list(disk_set.overlapping(Interval(Bound.gt(5), Bound.lt_inf())))
+        [<Interval [6, 7]>]
+        >>> disk_set.close()
+        >>> os.remove(path)
+        """
+
+        layout = self._layout
+        if self._is_unbounded():
+            if interval.overlaps(layout.interval(0)):
+                yield layout.interval(0)
+            return
+
+        encode = layout.codec.encode
+        lower_value = interval.lower.value
+        upper_value = interval.upper.value
+
+        # intervals ending before the lower value can't overlap it,
+        # the ones ending right at it may
+        index = 0
+        if _finite(lower_value):
+            index = bisect_left(layout.uppers, encode(lower_value))
+
+        upper_finite = _finite(upper_value)
+        if upper_finite:
+            upper_value = encode(upper_value)
+
+        lowers = layout.lowers
+        for index in range(index, layout.count):
+            if upper_finite and lowers[index] > upper_value:
+                break
+
+            candidate = layout.interval(index)
+            if candidate.overlaps(interval):
+                yield candidate
+
+    def _prepare(self, other, path):
+        """
+        Returns a sorted list of intervals of another set (or a collection
+        of intervals, joined like in an IntervalSet) and the type
+        of values which can store both sets.
+        """
+
+        if os.path.abspath(path) == os.path.abspath(self.path):
+            raise ValueError(
+                'The result can\'t be written to the file of the set'
+            )
+
+        if isinstance(other, Interval):
+            other = (other, )
+        if not isinstance(other, IntervalSet):
+            other = IntervalSet(other)
+        other = sorted(other)
+
+        value_types = set()
+        if self._layout.count and not self._is_unbounded():
+            value_types.add(self._layout.value_type)
+
+        values = [
+            value for interval in other
+            for value in _finite_values(interval)
+        ]
+        if values:
+            value_types.add(_value_type(values))
+
+        return other, _common_type(value_types)
+
+    def union(self, other, path):
+        """
+        Writes the union with another set to a new file at path
+        and returns it as a DiskIntervalSet.
+        """
+
+        other, value_type = self._prepare(other, path)
+        _write(path, iter_union(heapq.merge(self, other)), value_type)
+        return self.__class__(path)
+
+    def intersection(self, other, path):
+        """
+        Writes the intersection with another set to a new file at path
+        and returns it as a DiskIntervalSet.
+        """
+
+        other, value_type = self._prepare(other, path)
+        _write(path, iter_intersection(self, other), value_type)
+        return self.__class__(path)
+
+    def difference(self, other, path):
+        """
+        Writes the parts of this set, which aren't in another set,
+        to a new file at path and returns them as a DiskIntervalSet.
+        """
+
+        other, value_type = self._prepare(other, path)
+        _write(path, iter_difference(self, other), value_type)
+        return self.__class__(path)
@@ -40,6 +40,16 @@ True
 False
 >>> NEGATIVE_INFINITY < NEGATIVE_INFINITY
 False
+>>> INFINITY >= INFINITY and INFINITY <= INFINITY
+True
+>>> NEGATIVE_INFINITY >= NEGATIVE_INFINITY
+True
+>>> NEGATIVE_INFINITY <= NEGATIVE_INFINITY
+True
+>>> NEGATIVE_INFINITY < INFINITY and INFINITY > NEGATIVE_INFINITY
+True
+>>> INFINITY != INFINITY or NEGATIVE_INFINITY != NEGATIVE_INFINITY
+False
 
 >>> import sys
 >>> INFINITY > sys.maxsize and -sys.maxsize > NEGATIVE_INFINITY
@@ -49,6 +59,14 @@ True
 
 >>> sorted(set([INFINITY, INFINITY, NEGATIVE_INFINITY, NEGATIVE_INFINITY]))
 [-inf, inf]
+
+Both infinities stay singletons when pickled:
+
+>>> import pickle
+>>> pickle.loads(pickle.dumps(INFINITY)) is INFINITY
+True
+>>> pickle.loads(pickle.dumps(NEGATIVE_INFINITY)) is NEGATIVE_INFINITY
+True
 """
 
 
@@ -57,18 +75,22 @@ class _Indeterminate(object):
     # https://docs.python.org/2/library/datetime.html#date-objects
     timetuple = tuple()
 
+    # both infinities are singletons, so comparisons only need
+    # to check whether the other object is the same instance
+
     def __eq__(self, other):
         return other is self
 
+    def __ne__(self, other):
+        return other is not self
+
     def __hash__(self):
         return hash(repr(self))
 
 
 class _NegativeInfinity(_Indeterminate):
     def __lt__(self, other):
-        if self == other:
-            return False
-        return True
+        return other is not self
 
     def __le__(self, other):
         return True
@@ -77,23 +99,24 @@ class _NegativeInfinity(_Indeterminate):
         return False
 
     def __ge__(self, other):
-        return False
+        return other is self
 
     def __repr__(self):
         return '-inf'
 
+    def __reduce__(self):
+        return 'NEGATIVE_INFINITY'
+
 
 class _Infinity(_Indeterminate):
     def __lt__(self, other):
         return False
 
     def __le__(self, other):
-        return False
+        return other is self
 
     def __gt__(self, other):
-        if other == self:
-            return False
-        return True
+        return other is not self
 
     def __ge__(self, other):
         return True
@@ -101,6 +124,9 @@ class _Infinity(_Indeterminate):
     def __repr__(self):
         return 'inf'
 
+    def __reduce__(self):
+        return 'INFINITY'
+
 
 INFINITY = _Infinity()
 NEGATIVE_INFINITY = _NegativeInfinity()
@@ -0,0 +1,197 @@
+"""
+Opt-in instrumentation of interval operations.
+
+Hooks are callables registered with :func:`add_hook` (or temporarily,
+with the :func:`hooked` context manager), which are called with an
+:class:`Event` after every instrumented operation: the union,
+intersection, set_intersection, invert, difference, coverage
+and at_least functions and IntervalSet operations and mutations.
+
+When there are no hooks, instrumented functions only check that
+and call the original function.
+
+>>> from pyinter import Interval, IntervalSet, union
+>>> events = []
+>>> with hooked(events.append):
+...     result = union(Interval.closed(0, 2), Interval.closed(1, 3))
+>>> event = events[0]
+>>> event.operation, event.input_size, event.output_size
+('union', 2, 1)
+>>> event.elapsed >= 0
+True
+
+>>> counters = Counters()
+>>> with hooked(counters):
+...     interval_set = IntervalSet([Interval.closed(0, 1)])
+...     interval_set.add(Interval.closed(5, 6))
+...     interval_set.add(Interval.closed(8, 9))
+...     interval_set.discard(Interval.closed(0, 6))
+>>> counters.calls['IntervalSet.add']
+2
+>>> counters.output_sizes['IntervalSet.discard']
+1
+
+Operations outside of the block aren't reported:
+
+>>> calls = dict(counters.calls)
+>>> union(Interval.closed(0, 2), Interval.closed(1, 3))
+[<Interval [0, 3]>]
+>>> dict(counters.calls) == calls
+True
+"""
+
+import collections
+import functools
+import timeit
+
+
+class Event(collections.namedtuple(
+    'Event', ('operation', 'input_size', 'output_size', 'elapsed')
+)):
+    """
+    Describes a single call of an instrumented operation: its name,
+    the number of intervals passed to it and returned from it (or left in
+    the set after a mutation), None if they can't be counted, and the time
+    the operation took in seconds.
+    """
+
+    __slots__ = ()
+
+
+# the list is replaced instead of being modified,
+# so it can be iterated over while hooks are added or removed
+_hooks = []
+
+
+def add_hook(hook):
+    """
+    Registers a callable, which will be called with an :class:`Event`
+    after each instrumented operation.
+    """
+
+    global _hooks
+    _hooks = _hooks + [hook]
+
+
+def remove_hook(hook):
+    """
+    Unregisters a hook added by :func:`add_hook`.
+    """
+
+    global _hooks
+    hooks = list(_hooks)
+    hooks.remove(hook)
+    _hooks = hooks
+
+
+class hooked(object):
+    """
+    A context manager registering the hook only inside its block.
+    """
+
+    def __init__(self, hook):
+        self.hook = hook
+
+    def __enter__(self):
+        add_hook(self.hook)
+        return self.hook
+
+    def __exit__(self, *exc_info):
+        remove_hook(self.hook)
+
+
+class Counters(object):
+    """
+    A hook summing up the number of calls, input and output sizes
+    and elapsed time of each operation.
+    """
+
+    def __init__(self):
+        self.calls = collections.defaultdict(int)
+        self.input_sizes = collections.defaultdict(int)
+        self.output_sizes = collections.defaultdict(int)
+        self.elapsed = collections.defaultdict(float)
+
+    def __call__(self, event):
+        operation = event.operation
+        self.calls[operation] += 1
+        self.input_sizes[operation] += event.input_size or 0
+        self.output_sizes[operation] += event.output_size or 0
+        self.elapsed[operation] += event.elapsed
+
+
+def cardinality(item):
+    """
+    Returns the number of intervals in an interval, a sequence of intervals
+    or a set, None for iterators, which can't be counted without
+    consuming them.
+
+    >>> from pyinter import Interval, IntervalSet
+    >>> cardinality(Interval.closed(0, 1))
+    1
+    >>> cardinality([Interval.closed(0, 1), Interval.closed(2, 3)])
+    2
+    >>> cardinality(IntervalSet([Interval.closed(0, 1)]))
+    1
+    >>> cardinality(iter([Interval.closed(0, 1)])) is None
+    True
+    """
+
+    if hasattr(item, 'lower') and hasattr(item, 'upper'):
+        return 1
+
+    try:
+        return len(getattr(item, 'intervals', item))
+    except TypeError:
+        return None
+
+
+def _total_cardinality(items):
+    total = 0
+    for item in items:
+        count = cardinality(item)
+        if count is None:
+            return None
+        total += count
+    return total
+
+
+def instrumented(operation, mutation=False, skip_args=0):
+    """
+    Decorates a function to report its calls to the hooks.
+    The input size is the number of intervals in all positional arguments,
+    apart from the first skip_args ones (eg. a count), the output size
+    is the number of intervals returned or, for mutations, left in
+    the first argument (self).
+
+    >>> from pyinter import Interval, at_least
+    >>> events = []
+    >>> with hooked(events.append):
+    ...     result = at_least(2, Interval.closed(0, 2), Interval.closed(1, 3))
+    >>> events[0].operation, events[0].input_size, events[0].output_size
+    ('at_least', 2, 1)
+    """
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _hooks:
+                return function(*args, **kwargs)
+
+            input_size = _total_cardinality(args[skip_args:])
+
+            start = timeit.default_timer()
+            result = function(*args, **kwargs)
+            elapsed = timeit.default_timer() - start
+
+            output_size = cardinality(args[0] if mutation else result)
+
+            event = Event(operation, input_size, output_size, elapsed)
+            for hook in _hooks:
+                hook(event)
+
+            return result
+
+        return wrapper
+
+    return decorator
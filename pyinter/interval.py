@@ -1,8 +1,15 @@
+import heapq
 import operator
-import itertools
 
+from ._compat import text_type, to_str
 from .bound import Bound
 from .extrema import INFINITY, NEGATIVE_INFINITY
+from .instrumentation import instrumented
+
+
+# pyinter.interval_set imports this module, so IntervalSet is imported
+# (once) when the first set is created, see Interval._create_set
+_IntervalSet = None
 
 
 def _list_bounds(intervals):
@@ -18,9 +25,127 @@ def _list_bounds(intervals):
             (interval.upper, interval),
         ))
 
-    return sorted(bounds, key=lambda i: i[0])
+    return sorted(bounds, key=_bound_key)
+
+
+def _is_normalized(intervals):
+    """
+    Checks whether the given sequence of intervals is sorted
+    and the intervals don't overlap.
+
+    >>> _is_normalized([Interval.closed(0, 1), Interval.open(1, 2)])
+    True
+    >>> _is_normalized([Interval.closed(0, 1), Interval.closed(1, 2)])
+    False
+    >>> _is_normalized([Interval.closed(2, 3), Interval.closed(0, 1)])
+    False
+    """
+
+    return all(
+        intervals[index].upper._key < intervals[index + 1].lower._key
+        for index in range(len(intervals) - 1)
+    )
+
+
+def _set_bounds(intervals):
+    """
+    Returns a sorted list of bounds that belong to the given sequence
+    of intervals, without sorting them if the intervals are already sorted
+    and don't overlap.
+    Each item is a tuple of (bound, owner_interval).
+    """
+
+    if not _is_normalized(intervals):
+        return _list_bounds(intervals)
+
+    bounds = []
+    for interval in intervals:
+        bounds.extend((
+            (interval.lower, interval),
+            (interval.upper, interval),
+        ))
+
+    return bounds
+
+
+def _collection_bounds(intervals):
+    """
+    Returns a sorted list of bounds that belong to the given collection
+    of intervals, reusing the list cached by IntervalSets.
+    Each item is a tuple of (bound, owner_interval).
+    """
+
+    cached_bounds = getattr(intervals, '_bound_list', None)
+    if cached_bounds is not None:
+        return cached_bounds()
+
+    return _set_bounds(list(intervals))
+
+
+def _tag_bounds(bounds, tag):
+    for position, (bound, interval) in enumerate(bounds):
+        yield bound._key, tag, position, bound, interval
+
+
+def _merge_bounds(bound_lists):
+    """
+    Lazily merges sorted iterables of (bound, owner_interval) tuples,
+    used by the streaming sweeps, which can't sort their input.
+    Yields (bound, tag, owner_interval) tuples, where tag is the index
+    of the iterable the bound comes from.
+
+    >>> list(_merge_bounds([
+    ...     _set_bounds([Interval.closed(0, 1), Interval.closed(4, 5)]),
+    ...     _set_bounds([Interval.open(1, 2)]),
+    ... ]))
+    [(<Bound [0>, 0, <Interval [0, 1]>),
+     (<Bound 1]>, 0, <Interval [0, 1]>),
+     (<Bound (1>, 1, <Interval (1, 2)>),
+     (<Bound 2)>, 1, <Interval (1, 2)>),
+     (<Bound [4>, 0, <Interval [4, 5]>),
+     (<Bound 5]>, 0, <Interval [4, 5]>)]
+    """
 
+    # tags and positions make sure bounds and owner intervals
+    # are never compared, only their keys
+    streams = [
+        _tag_bounds(bounds, tag)
+        for tag, bounds in enumerate(bound_lists)
+    ]
 
+    for _, tag, _, bound, interval in heapq.merge(*streams):
+        yield bound, tag, interval
+
+
+def _bound_key(item):
+    return item[0]._key
+
+
+def _sorted_bounds(interval_sets):
+    """
+    Returns a sorted list of bounds that belong to the given collections
+    of intervals. Bounds of each collection are sorted separately
+    (which is skipped for sorted, non-overlapping collections,
+    eg. IntervalSets, which also cache them) and then concatenated
+    and sorted again, which timsort does by merging the sorted runs.
+    Each item is a tuple of (bound, owner_interval).
+    """
+
+    bound_lists = [
+        _collection_bounds(intervals) for intervals in interval_sets
+    ]
+
+    if len(bound_lists) == 1:
+        return bound_lists[0]
+
+    bounds = []
+    for bound_list in bound_lists:
+        bounds.extend(bound_list)
+    bounds.sort(key=_bound_key)
+    return bounds
+
+
+@instrumented('union')
 def union(*intervals, **kwargs):
     """
     Returns the union of intervals.
@@ -114,13 +239,44 @@ def union(*intervals, **kwargs):
 
     ignore_data = kwargs.pop('ignore_data', False)
 
-    bounds = _list_bounds(intervals)
+    return list(_iter_sweep_union(_list_bounds(intervals), ignore_data))
+
+
+def _union_sets(interval_sets, ignore_data=False):
+    """
+    Returns the union of all the intervals in the given collections,
+    see :func:`union`. Bounds of sorted, non-overlapping collections
+    (eg. IntervalSets) are merged without sorting them again.
+
+    >>> _union_sets([
+    ...   [Interval.closed(0, 3, 'a'), Interval.closed(13, 21, 'a')],
+    ...   [Interval.closed(2, 8, 'a'), Interval.closed(16, 19, 'a')],
+    ...   [Interval.closed(5, 11, 'b'), Interval.closed(16, 24, 'b')],
+    ... ])
+    [<Interval [0, 5): a>,
+     <Interval [5, 8]: a, b>,
+     <Interval (8, 11]: b>,
+     <Interval [13, 16): a>,
+     <Interval [16, 21]: a, b>,
+     <Interval (21, 24]: b>]
+    """
+
+    return list(_iter_sweep_union(_sorted_bounds(interval_sets), ignore_data))
+
+
+def _iter_sweep_union(bounds, ignore_data):
+    """
+    Yields the union of intervals, given an iterable of their sorted bounds.
+    Intervals are yielded as soon as they can't be extended any more.
+    """
 
     union = []
 
     lower_bound = None
     level = 0
-    data_stack = []
+    # number of currently open intervals holding each data item,
+    # data_set contains the items with non-zero counts
+    data_counts = {}
     data_set = set()
 
     def add_interval(lower, upper):
@@ -134,21 +290,31 @@ def union(*intervals, **kwargs):
             and last_interval.upper.is_opposite_of(lower)
             and last_interval.data == data_set
         ):
-            last_interval._upper = upper
+            union[-1] = Interval(
+                last_interval.lower, upper, data_set=data_set
+            )
             return
 
         union.append(Interval(lower, upper, data_set=data_set))
 
     for bound, interval in bounds:
-        if bound.is_lower:
+        # only the last interval can still be joined with the next one
+        while len(union) > 1:
+            yield union.pop(0)
+
+        if bound._is_lower:
             level += 1
 
-            if not lower_bound:
+            if lower_bound is None:
                 lower_bound = bound
 
-            if not ignore_data:
-                data_stack.extend(interval.data)
-                new_items = interval.data - data_set
+            if not ignore_data and interval.data:
+                new_items = []
+                for item in interval.data:
+                    count = data_counts.get(item, 0)
+                    data_counts[item] = count + 1
+                    if not count:
+                        new_items.append(item)
 
                 if new_items:
                     add_interval(lower_bound, ~bound)
@@ -160,23 +326,30 @@ def union(*intervals, **kwargs):
             if not level:
                 add_interval(lower_bound, bound)
                 lower_bound = None
-                data_stack = []
+                data_counts.clear()
                 data_set.clear()
                 continue
 
             if not ignore_data and interval.data:
+                removed_items = []
                 for item in interval.data:
-                    data_stack.remove(item)
-
-                new_data_set = set(data_stack)
-                if new_data_set != data_set:
+                    count = data_counts[item] - 1
+                    if count:
+                        data_counts[item] = count
+                    else:
+                        del data_counts[item]
+                        removed_items.append(item)
+
+                if removed_items:
                     add_interval(lower_bound, bound)
                     lower_bound = ~bound
-                    data_set = new_data_set
+                    data_set.difference_update(removed_items)
 
-    return union
+    for interval in union:
+        yield interval
 
 
+@instrumented('intersection')
 def intersection(*intervals, **kwargs):
     """
     Returns the intersection of all the intervals.
@@ -280,7 +453,7 @@ def intersection(*intervals, **kwargs):
     level = 0
 
     for bound, interval in bounds:
-        if bound.is_lower:
+        if bound._is_lower:
             level += 1
 
             if level == len(intervals):
@@ -296,6 +469,7 @@ def intersection(*intervals, **kwargs):
     return intersection
 
 
+@instrumented('set_intersection')
 def set_intersection(*interval_sets, **kwargs):
     """
     Returns the intersection of the given interval sets.
@@ -353,38 +527,162 @@ def set_intersection(*interval_sets, **kwargs):
 
     ignore_data = kwargs.get('ignore_data', False)
 
-    all_bounds = _list_bounds(itertools.chain(*interval_sets))
+    all_bounds = _sorted_bounds(interval_sets)
 
-    intersection = []
+    return list(_iter_sweep_set_intersection(
+        all_bounds, len(interval_sets), ignore_data
+    ))
+
+
+def _iter_sweep_set_intersection(bounds, count, ignore_data):
+    """
+    Yields the intersection of count interval sets,
+    given an iterable of their sorted bounds.
+    """
 
     lower_bound = None
-    data_stack = []
+    # number of currently open intervals holding each data item
+    data_counts = {}
     level = 0
 
-    for bound, interval in all_bounds:
-        if bound.is_lower:
+    for bound, interval in bounds:
+        if bound._is_lower:
             level += 1
 
             if not ignore_data:
-                data_stack.extend(interval.data)
+                for item in interval.data:
+                    data_counts[item] = data_counts.get(item, 0) + 1
 
-            if level == len(interval_sets):
+            if level == count:
                 lower_bound = bound
         else:
-            if level == len(interval_sets):
-                intersection.append(
-                    Interval(lower_bound, bound, data_set=set(data_stack))
-                )
+            if level == count:
+                yield Interval(lower_bound, bound, data_set=set(data_counts))
 
             if not ignore_data:
                 for item in interval.data:
-                    data_stack.remove(item)
+                    count_left = data_counts[item] - 1
+                    if count_left:
+                        data_counts[item] = count_left
+                    else:
+                        del data_counts[item]
 
             level -= 1
 
-    return intersection
 
+def _iter_stream_bounds(intervals):
+    """
+    Yields sorted (bound, owner_interval) tuples for an iterable of
+    intervals sorted by their lower bounds. Only the upper bounds of
+    currently open intervals are kept in memory.
+    """
+
+    open_uppers = []
+    previous_key = None
+
+    for position, interval in enumerate(intervals):
+        lower = interval.lower
+
+        if previous_key is not None and lower._key < previous_key:
+            raise ValueError(
+                'intervals must be sorted by their lower bounds, '
+                '{} comes after {}'.format(interval, previous_interval)
+            )
+        previous_key = lower._key
+        previous_interval = interval
+
+        while open_uppers and open_uppers[0][0] < lower._key:
+            _, _, upper, owner = heapq.heappop(open_uppers)
+            yield upper, owner
 
+        yield lower, interval
+
+        upper = interval.upper
+        heapq.heappush(open_uppers, (upper._key, position, upper, interval))
+
+    while open_uppers:
+        _, _, upper, owner = heapq.heappop(open_uppers)
+        yield upper, owner
+
+
+def iter_union(intervals, ignore_data=False):
+    """
+    Lazily calculates the union of an iterable of intervals sorted by
+    their lower bounds (eg. read from a file) and yields the resulting
+    intervals as soon as they're final, see :func:`union`.
+    Only the currently open intervals are kept in memory.
+
+    >>> intervals = iter([
+    ...   Interval.closed(0, 3, 'a'),
+    ...   Interval.closed(2, 8, 'a'),
+    ...   Interval.closed(5, 11, 'b'),
+    ...   Interval.closed(13, 21, 'a'),
+    ...   Interval.closed(16, 19, 'a'),
+    ...   Interval.closed(16, 24, 'b'),
+    ... ])
+    >>> result = iter_union(intervals)
+    >>> next(result)
+    <Interval [0, 5): a>
+    >>> list(result)
+    [<Interval [5, 8]: a, b>,
+     <Interval (8, 11]: b>,
+     <Interval [13, 16): a>,
+     <Interval [16, 21]: a, b>,
+     <Interval (21, 24]: b>]
+
+    >>> list(iter_union([
+    ...   Interval.closed(0, 3, 'a'),
+    ...   Interval.closed(3, 8, 'b'),
+    ...   Interval.open(8, 9),
+    ... ], ignore_data=True))
+    [<Interval [0, 9)>]
+
+    >>> list(iter_union([Interval.closed(2, 3), Interval.closed(0, 1)]))
+    Traceback (most recent call last):
+    ...
+    ValueError: intervals must be sorted by their lower bounds,
+    [0, 1] comes after [2, 3]
+    """
+
+    return _iter_sweep_union(_iter_stream_bounds(intervals), ignore_data)
+
+
+def iter_intersection(*interval_iterables, **kwargs):
+    """
+    Lazily calculates the intersection of iterables of intervals,
+    each of them sorted by lower bounds and without overlapping intervals,
+    and yields the resulting intervals, see :func:`set_intersection`.
+    Only the currently open intervals are kept in memory.
+
+    >>> result = iter_intersection(
+    ...   iter([Interval.closed(0, 3), Interval.closed(5, 8),
+    ...         Interval.closed(14, 18)]),
+    ...   iter([Interval.closed(4, 8, 'a'), Interval.closed(11, 16, 'b')]),
+    ...   iter([Interval.closed(2, 17)]),
+    ... )
+    >>> next(result)
+    <Interval [5, 8]: a>
+    >>> list(result)
+    [<Interval [14, 16]: b>]
+
+    >>> list(iter_intersection())
+    []
+    """
+
+    ignore_data = kwargs.pop('ignore_data', False)
+
+    bounds = _merge_bounds([
+        _iter_stream_bounds(intervals) for intervals in interval_iterables
+    ])
+
+    return _iter_sweep_set_intersection(
+        ((bound, interval) for bound, _, interval in bounds),
+        len(interval_iterables),
+        ignore_data,
+    )
+
+
+@instrumented('invert')
 def invert(*intervals):
     """
     Returns the complement of the given intervals (with no data).
@@ -427,7 +725,7 @@ def invert(*intervals):
             inverted.append(Interval(lower, upper))
 
     for bound, interval in bounds:
-        if bound.is_lower:
+        if bound._is_lower:
             add_interval(lower_bound, ~bound)
         else:
             lower_bound = ~bound
@@ -437,9 +735,390 @@ def invert(*intervals):
     return inverted
 
 
+def _non_overlapping(intervals):
+    """
+    Returns the collection of intervals as it is if they don't overlap,
+    otherwise their union (with data).
+
+    >>> _non_overlapping([Interval.closed(2, 3), Interval.closed(0, 1)])
+    [<Interval [2, 3]>, <Interval [0, 1]>]
+    >>> _non_overlapping([Interval.closed(0, 2), Interval.closed(1, 3, 'a')])
+    [<Interval [0, 1)>, <Interval [1, 3]: a>]
+    """
+
+    lower_bounds = getattr(intervals, '_lower_bounds', None)
+    if lower_bounds is not None:
+        # IntervalSets sort and check their intervals once
+        if lower_bounds() is not False:
+            return intervals
+    else:
+        intervals = list(intervals)
+        if _is_normalized(intervals) or _is_normalized(sorted(intervals)):
+            return intervals
+
+    return _union_sets([intervals])
+
+
+@instrumented('difference')
 def difference(base_intervals, subtracting_intervals):
-    mask = invert(*subtracting_intervals)
-    return set_intersection(base_intervals, mask)
+    """
+    Returns the parts of base intervals, which aren't covered by any
+    of the subtracting intervals, keeping the data of the base intervals.
+    Overlapping base intervals are joined like in their union first.
+
+    >>> difference([Interval.closed(0, 10, 'data')], [])
+    [<Interval [0, 10]: data>]
+
+    >>> difference(
+    ...   [Interval.closed(0, 10, 'data')],
+    ...   [Interval.open(2, 4), Interval.closed(3, 5), Interval.open(8, 12)],
+    ... )
+    [<Interval [0, 2]: data>, <Interval (5, 8]: data>]
+
+    0123456789012345678
+    [ a  ]  [ b ]  [c ]
+      [ ]  [ ]  [     ]
+    -------------------
+    [a) (]   (b )
+
+    >>> difference(
+    ...   [Interval.closed(0, 5, 'a'), Interval.closed(8, 12, 'b'),
+    ...    Interval.closed(15, 18, 'c')],
+    ...   [Interval.closed(2, 4), Interval.closed(7, 9),
+    ...    Interval.closed(12, 18)],
+    ... )
+    [<Interval [0, 2): a>, <Interval (4, 5]: a>, <Interval (9, 12): b>]
+
+    >>> difference([Interval.closed(0, 2)], [Interval.closed(0, 2)])
+    []
+
+    >>> difference(
+    ...   [Interval.closed(0, 5, 'a'), Interval.closed(2, 8)],
+    ...   [Interval.closed(3, 4)],
+    ... )
+    [<Interval [0, 3): a>, <Interval (4, 5]: a>, <Interval (5, 8]>]
+    """
+
+    # a stable sort of the concatenated (sorted) runs of both collections,
+    # see _sorted_bounds, with base bounds before equal subtracting ones
+    bounds = [
+        (bound, 0, interval) for bound, interval
+        in _collection_bounds(_non_overlapping(base_intervals))
+    ]
+    bounds.extend(
+        (bound, 1, interval) for bound, interval
+        in _collection_bounds(subtracting_intervals)
+    )
+    bounds.sort(key=_bound_key)
+
+    return list(_iter_sweep_difference(bounds))
+
+
+def _iter_sweep_difference(bounds):
+    """
+    Yields the parts of base intervals not covered by subtracting ones,
+    given an iterable of their sorted (bound, subtracting, owner_interval)
+    tuples, see :func:`_merge_bounds`.
+    """
+
+    lower_bound = None
+    base_interval = None
+    level = 0
+
+    for bound, subtracting, interval in bounds:
+        if subtracting:
+            if bound._is_lower:
+                if (
+                    not level and base_interval is not None
+                    and lower_bound < ~bound
+                ):
+                    yield Interval(
+                        lower_bound, ~bound, data_set=base_interval.data
+                    )
+                level += 1
+            else:
+                level -= 1
+                if not level and base_interval is not None:
+                    lower_bound = ~bound
+        else:
+            if bound._is_lower:
+                base_interval = interval
+                lower_bound = bound
+            else:
+                if not level and lower_bound < bound:
+                    yield Interval(
+                        lower_bound, bound, data_set=base_interval.data
+                    )
+                base_interval = None
+
+
+def iter_difference(base_intervals, subtracting_intervals):
+    """
+    Lazily calculates the parts of base intervals not covered by any
+    of the subtracting intervals and yields them, see :func:`difference`.
+    Both iterables have to be sorted by lower bounds, base intervals
+    must not overlap. Only the currently open intervals are kept in memory.
+
+    >>> result = iter_difference(
+    ...   iter([Interval.closed(0, 5, 'a'), Interval.closed(8, 12, 'b'),
+    ...         Interval.closed(15, 18, 'c')]),
+    ...   iter([Interval.closed(2, 4), Interval.closed(7, 9),
+    ...         Interval.closed(12, 18)]),
+    ... )
+    >>> next(result)
+    <Interval [0, 2): a>
+    >>> list(result)
+    [<Interval (4, 5]: a>, <Interval (9, 12): b>]
+    """
+
+    return _iter_sweep_difference(_merge_bounds([
+        _iter_stream_bounds(base_intervals),
+        _iter_stream_bounds(subtracting_intervals),
+    ]))
+
+
+def _iter_sweep_coverage(bounds):
+    """
+    Yields (interval, count) tuples splitting the covered parts of the line
+    into segments, with the number of intervals covering each of them,
+    given an iterable of their sorted bounds. Adjacent segments
+    with the same count are joined.
+    """
+
+    pending = None
+    lower_bound = None
+    level = 0
+
+    for bound, _ in bounds:
+        # the segment between the previous bound and this one
+        if level:
+            upper_bound = ~bound if bound._is_lower else bound
+
+        if level and lower_bound < upper_bound:
+            if (
+                pending is not None
+                and pending[2] == level
+                and pending[1].is_opposite_of(lower_bound)
+            ):
+                pending[1] = upper_bound
+            else:
+                if pending is not None:
+                    yield Interval(pending[0], pending[1]), pending[2]
+                pending = [lower_bound, upper_bound, level]
+
+        if bound._is_lower:
+            level += 1
+            lower_bound = bound
+        else:
+            level -= 1
+            # nothing is covered after the last upper bound of a group
+            if level:
+                lower_bound = ~bound
+
+    if pending is not None:
+        yield Interval(pending[0], pending[1]), pending[2]
+
+
+@instrumented('coverage')
+def coverage(*intervals):
+    """
+    Returns the segments of the line covered by the intervals, as a list
+    of (interval, count) tuples, where count is the number of intervals
+    covering the segment (eg. the number of jobs running at the same time).
+    Neighbouring segments with the same count are joined, the data
+    of the intervals is ignored.
+
+    0123456789
+    [   ]
+      [     ]
+        [ ]
+    ----------
+    1 2 3 2 1
+
+    >>> coverage(
+    ...   Interval.closed(0, 4),
+    ...   Interval.closed(2, 8),
+    ...   Interval.closed(4, 6),
+    ... )
+    [(<Interval [0, 2)>, 1),
+     (<Interval [2, 4)>, 2),
+     (<Interval [4, 4]>, 3),
+     (<Interval (4, 6]>, 2),
+     (<Interval (6, 8]>, 1)]
+
+    >>> coverage(
+    ...   Interval.closed_open(0, 2),
+    ...   Interval.closed(2, 3),
+    ...   Interval.open(5, 6),
+    ... )
+    [(<Interval [0, 3]>, 1), (<Interval (5, 6)>, 1)]
+
+    >>> coverage(
+    ...   Interval(Bound.gt_ninf(), Bound.lt_inf()),
+    ...   Interval.closed(0, 1),
+    ... )
+    [(<Interval (-inf, 0)>, 1),
+     (<Interval [0, 1]>, 2),
+     (<Interval (1, inf)>, 1)]
+
+    >>> coverage()
+    []
+    """
+
+    return list(_iter_sweep_coverage(_list_bounds(intervals)))
+
+
+@instrumented('at_least', skip_args=1)
+def at_least(count, *intervals):
+    """
+    Returns the parts of the line covered by at least count
+    of the intervals (with no data), see :func:`coverage`.
+
+    >>> intervals = [
+    ...   Interval.closed(0, 4),
+    ...   Interval.closed(2, 8),
+    ...   Interval.closed(4, 6),
+    ...   Interval.open(8, 9),
+    ... ]
+    >>> at_least(2, *intervals)
+    [<Interval [2, 6]>]
+    >>> at_least(1, *intervals) == union(*intervals)
+    True
+    >>> at_least(4, *intervals)
+    []
+    >>> at_least(0, *intervals)
+    Traceback (most recent call last):
+    ...
+    ValueError: count must be positive, got 0
+    """
+
+    if count < 1:
+        raise ValueError('count must be positive, got {}'.format(count))
+
+    covered = []
+
+    for segment, segment_count in _iter_sweep_coverage(
+        _list_bounds(intervals)
+    ):
+        if segment_count < count:
+            continue
+
+        if covered and covered[-1].upper.is_opposite_of(segment.lower):
+            covered[-1] = Interval(covered[-1].lower, segment.upper)
+        else:
+            covered.append(segment)
+
+    return covered
+
+
+def _intersect_pair(a, b, ignore_data=False):
+    """
+    Returns the intersection of two intervals or None, like
+    :func:`intersection`, by comparing their bounds directly.
+
+    >>> _intersect_pair(Interval.closed(0, 2, 'a'), Interval.open(1, 3, 'b'))
+    <Interval (1, 2]: a, b>
+    >>> _intersect_pair(Interval.closed(0, 1), Interval.open(1, 2)) is None
+    True
+    """
+
+    lower = a._lower if a._lower._key > b._lower._key else b._lower
+    upper = a._upper if a._upper._key < b._upper._key else b._upper
+
+    if lower._key > upper._key:
+        return None
+
+    if ignore_data:
+        return Interval(lower, upper)
+
+    return Interval(lower, upper, data_set=a._data | b._data)
+
+
+def _union_pair(a, b, ignore_data=False):
+    """
+    Returns a list with the union of two intervals, like :func:`union`,
+    by comparing their bounds directly.
+
+    >>> _union_pair(Interval.closed(3, 5), Interval.closed(0, 1))
+    [<Interval [0, 1]>, <Interval [3, 5]>]
+    >>> _union_pair(Interval.closed(0, 1, 'a'), Interval.open(1, 2, 'a'))
+    [<Interval [0, 2): a>]
+    >>> _union_pair(Interval.open(1, 5), Interval.open(2, 3, 'data'))
+    [<Interval (1, 2]>, <Interval (2, 3): data>, <Interval [3, 5)>]
+    >>> _union_pair(Interval.open(1, 3, 'a'), Interval.open(2, 5))
+    [<Interval (1, 3): a>, <Interval [3, 5)>]
+    """
+
+    if b._lower._key < a._lower._key:
+        a, b = b, a
+
+    a_data = set() if ignore_data else a._data
+    b_data = set() if ignore_data else b._data
+
+    if a._upper._key < b._lower._key:
+        # disjoint, joined only if adjacent and holding the same data
+        if a_data == b_data and a._upper.is_opposite_of(b._lower):
+            return [Interval(a._lower, b._upper, data_set=a_data)]
+        return [
+            Interval(a._lower, a._upper, data_set=a_data),
+            Interval(b._lower, b._upper, data_set=b_data),
+        ]
+
+    if a._upper._key < b._upper._key:
+        upper, tail_data = a._upper, b_data
+        tail_upper = b._upper
+    else:
+        upper, tail_data = b._upper, a_data
+        tail_upper = a._upper
+
+    pieces = (
+        (a._lower, ~b._lower, a_data),
+        (b._lower, upper, a_data | b_data),
+        (~upper, tail_upper, tail_data),
+    )
+
+    result = []
+    for lower, upper, data in pieces:
+        if lower._key > upper._key:
+            continue
+        if result and result[-1].data == data:
+            lower = result.pop().lower
+        result.append(Interval(lower, upper, data_set=data))
+
+    return result
+
+
+def _difference_pair(a, b):
+    """
+    Returns a list of parts of the interval a not covered by the interval b,
+    keeping the data of a, like :func:`difference`, by comparing their
+    bounds directly.
+
+    >>> _difference_pair(Interval.closed(1, 4, 'a'), Interval.open(2, 3))
+    [<Interval [1, 2]: a>, <Interval [3, 4]: a>]
+    >>> _difference_pair(Interval.closed(1, 4), Interval.closed(0, 2))
+    [<Interval (2, 4]>]
+    >>> _difference_pair(Interval.open(1, 2), Interval.open(0, 3))
+    []
+    """
+
+    if (
+        b._upper._key < a._lower._key
+        or a._upper._key < b._lower._key
+    ):
+        return [a]
+
+    result = []
+
+    upper = ~b._lower
+    if a._lower._key < upper._key:
+        result.append(Interval(a._lower, upper, data_set=a._data))
+
+    lower = ~b._upper
+    if lower._key < a._upper._key:
+        result.append(Interval(lower, a._upper, data_set=a._data))
+
+    return result
 
 
 class Interval(object):
@@ -479,14 +1158,22 @@ class Interval(object):
 
     >>> Interval(Bound(100.2, operator.gt), Bound(800.9, operator.lt), 'hello')
     <Interval (100.2, 800.9): hello>
+
+    Intervals (and their bounds) don't have an instance __dict__,
+    but can still be pickled:
+
+    >>> import pickle
+    >>> pickle.loads(pickle.dumps(Interval.open(1, 2, 'hello')))
+    <Interval (1, 2): hello>
     """
 
-    _lower = None
-    _upper = None
+    __slots__ = ('_lower', '_upper', '_data')
 
     def _create_set(self, intervals=()):
-        from .interval_set import IntervalSet
-        return IntervalSet(intervals, check_overlaps=False)
+        global _IntervalSet
+        if _IntervalSet is None:
+            from .interval_set import IntervalSet as _IntervalSet
+        return _IntervalSet(intervals, check_overlaps=False)
 
     @property
     def lower(self):
@@ -584,7 +1271,7 @@ class Interval(object):
         data_str = u''
         if self.data:
             data_str = u': {}'.format(
-                u', '.join(unicode(item) for item in sorted(self.data))
+                u', '.join(text_type(item) for item in sorted(self.data))
             )
 
         return u"{}, {}{}".format(
@@ -594,10 +1281,12 @@ class Interval(object):
         )
 
     def __str__(self):
-        return unicode(self).encode('utf-8')
+        return to_str(self.__unicode__())
 
-    def __cmp__(self, other):
+    def __eq__(self, other):
         """
+        Intervals are compared by their bounds, data is ignored.
+
         >>> Interval.open(1, 2) < Interval.open(2, 3)
         True
 
@@ -607,6 +1296,12 @@ class Interval(object):
         >>> Interval.open(1, 2) < Interval.open(1, 3)
         True
 
+        >>> Interval.open(1, 3) > Interval.open(1, 2)
+        True
+
+        >>> Interval.open(1, 2) <= Interval.open(1, 2) <= Interval.open(1, 3)
+        True
+
         >>> Interval.open(1, 2) == Interval.open(2, 3)
         False
 
@@ -618,11 +1313,58 @@ class Interval(object):
 
         >>> Interval.open(1, 2) == Interval.open(1, 3)
         False
+
+        >>> Interval.open(1, 2) != Interval.open(1, 3)
+        True
+
+        >>> Interval.open(1, 2) == None
+        False
+        >>> Interval.open(1, 2).__lt__(3) is NotImplemented
+        True
         """
 
+        if not isinstance(other, Interval):
+            return NotImplemented
+        return (
+            self._lower._key == other._lower._key
+            and self._upper._key == other._upper._key
+        )
+
+    def __ne__(self, other):
+        if not isinstance(other, Interval):
+            return NotImplemented
+        return not self == other
+
+    def __lt__(self, other):
+        if not isinstance(other, Interval):
+            return NotImplemented
+        return (
+            (self._lower._key, self._upper._key)
+            < (other._lower._key, other._upper._key)
+        )
+
+    def __le__(self, other):
+        if not isinstance(other, Interval):
+            return NotImplemented
+        return (
+            (self._lower._key, self._upper._key)
+            <= (other._lower._key, other._upper._key)
+        )
+
+    def __gt__(self, other):
+        if not isinstance(other, Interval):
+            return NotImplemented
+        return (
+            (self._lower._key, self._upper._key)
+            > (other._lower._key, other._upper._key)
+        )
+
+    def __ge__(self, other):
+        if not isinstance(other, Interval):
+            return NotImplemented
         return (
-            cmp(self.lower, other.lower)
-            or cmp(self.upper, other.upper)
+            (self._lower._key, self._upper._key)
+            >= (other._lower._key, other._upper._key)
         )
 
     def __hash__(self):
@@ -644,6 +1386,12 @@ class Interval(object):
 
         return hash((self.lower, self.upper))
 
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (self._lower, self._upper, None, self._data),
+        )
+
     def __and__(self, other):
         if not other:
             return self._create_set()
@@ -729,6 +1477,26 @@ class Interval(object):
         else:
             return self._contains_value(item)
 
+    def contains_many(self, values):
+        """
+        Checks which of the values are inside the interval and returns
+        a list of booleans.
+
+        >>> Interval.closed_open(1, 3).contains_many(range(5))
+        [False, True, True, False, False]
+        """
+
+        lower_operator = self.lower.operator
+        lower_value = self.lower.value
+        upper_operator = self.upper.operator
+        upper_value = self.upper.value
+
+        return [
+            lower_operator(value, lower_value)
+            and upper_operator(value, upper_value)
+            for value in values
+        ]
+
     def overlaps(self, other):
         """
         If self and other have any overlaping values returns True,
@@ -776,7 +1544,9 @@ class Interval(object):
         """
         Returns a new :class:`~pyinter.Interval` representing
         the intersection of this :class:`~pyinter.Interval`
-        with the other :class:`~pyinter.Interval`
+        with the other :class:`~pyinter.Interval`.
+        The bounds of both intervals are compared directly, without
+        the sweep used by :func:`intersection`.
 
         >>> Interval.open(1, 3) & Interval.closed(0, 1, 'data')
         <IntervalSet >
@@ -801,14 +1571,15 @@ class Interval(object):
         if not other:
             return None
 
-        result = intersection(self, other)
-        return result[0] if result else None
+        return _intersect_pair(self, other)
 
     def union(self, other):
         """
         Returns a list of Intervals representing the union of
         this :class:`~pyinter.Interval`
         with the other :class:`~pyinter.Interval`.
+        Overlapping intervals are split into at most three parts
+        with different data, without the sweep used by :func:`union`.
 
         >>> Interval.open(1, 3) | Interval.closed(0, 1)
         <IntervalSet [0, 3)>
@@ -828,7 +1599,7 @@ class Interval(object):
         <IntervalSet (1, 2], (2, 3): data, [3, 5)>
         """
 
-        result = union(self, other) if other else [self]
+        result = _union_pair(self, other) if other else [self]
         return self._create_set(result)
 
     def difference(self, other):
@@ -836,6 +1607,8 @@ class Interval(object):
         Returns a list of Intervals representing the difference
         between this :class:`~pyinter.Interval`
         and the other :class:`~pyinter.Interval`.
+        The bounds of both intervals are compared directly, without
+        the sweep used by :func:`difference`.
 
         >>> Interval.open(1, 4) - Interval.open(1, 2)
         <IntervalSet [2, 4)>
@@ -853,15 +1626,43 @@ class Interval(object):
         <IntervalSet >
         """
 
-        if other is None or not self.overlaps(other):
+        if other is None:
             result = [self]
         else:
-            result = difference((self,), (other,))
+            result = _difference_pair(self, other)
 
         return self._create_set(result)
 
+    def lazy(self):
+        """
+        Returns a :class:`~pyinter.lazy.LazyIntervalSet` wrapping this
+        interval, which defers operations until the result is needed.
+        """
+        from .lazy import LazyIntervalSet
+        return LazyIntervalSet(self)
+
     def complement(self):
-        return self._create_set(invert((self,)))
+        """
+        Returns an IntervalSet of values outside of the interval.
+
+        >>> Interval.closed(0, 1).complement()
+        <IntervalSet (-inf, 0), (1, inf)>
+        >>> Interval(Bound.gt_ninf(), Bound.le(1)).complement()
+        <IntervalSet (1, inf)>
+        >>> Interval(Bound.gt_ninf(), Bound.lt_inf()).complement()
+        <IntervalSet >
+        """
+
+        lower = ~self._lower
+        upper = ~self._upper
+        result = []
+
+        if lower.value is not NEGATIVE_INFINITY:
+            result.append(Interval(Bound.gt_ninf(), lower))
+        if upper.value is not INFINITY:
+            result.append(Interval(upper, Bound.lt_inf()))
+
+        return self._create_set(result)
 
     def copy(self, other):
         return self.__class__(
@@ -0,0 +1,272 @@
+import random
+
+from .bound import Bound
+# Interval is used in doctests
+from .interval import Interval
+
+
+class _Node(object):
+    __slots__ = ('interval', 'priority', 'left', 'right', 'max_upper')
+
+    def __init__(self, interval, priority):
+        self.interval = interval
+        self.priority = priority
+        self.left = None
+        self.right = None
+        self.max_upper = interval.upper
+
+
+def _update(node):
+    max_upper = node.interval.upper
+    if node.left is not None and node.left.max_upper > max_upper:
+        max_upper = node.left.max_upper
+    if node.right is not None and node.right.max_upper > max_upper:
+        max_upper = node.right.max_upper
+    node.max_upper = max_upper
+
+
+def _rotate_right(node):
+    left = node.left
+    node.left = left.right
+    left.right = node
+    _update(node)
+    _update(left)
+    return left
+
+
+def _rotate_left(node):
+    right = node.right
+    node.right = right.left
+    right.left = node
+    _update(node)
+    _update(right)
+    return right
+
+
+def _insert(node, new):
+    if node is None:
+        return new
+
+    if new.interval.lower < node.interval.lower:
+        node.left = _insert(node.left, new)
+        if node.left.priority > node.priority:
+            return _rotate_right(node)
+    else:
+        node.right = _insert(node.right, new)
+        if node.right.priority > node.priority:
+            return _rotate_left(node)
+
+    _update(node)
+    return node
+
+
+def _join(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+
+    if left.priority > right.priority:
+        left.right = _join(left.right, right)
+        _update(left)
+        return left
+    else:
+        right.left = _join(left, right.left)
+        _update(right)
+        return right
+
+
+def _same(a, b):
+    return a is b or (a == b and a.data == b.data)
+
+
+def _remove(node, interval):
+    """
+    Removes the interval from the subtree, returns a tuple of
+    (new subtree root, whether the interval was removed).
+    """
+
+    if node is None:
+        return None, False
+
+    if interval.lower < node.interval.lower:
+        node.left, removed = _remove(node.left, interval)
+    elif node.interval.lower < interval.lower:
+        node.right, removed = _remove(node.right, interval)
+    elif _same(node.interval, interval):
+        return _join(node.left, node.right), True
+    else:
+        # intervals with equal lower bounds can end up on both sides
+        node.left, removed = _remove(node.left, interval)
+        if not removed:
+            node.right, removed = _remove(node.right, interval)
+
+    if removed:
+        _update(node)
+
+    return node, removed
+
+
+def _search(node, lower, upper, result):
+    # recurse on the left, loop on the right, so the recursion depth
+    # stays proportional to the height of the tree
+    while node is not None and node.max_upper >= lower:
+        _search(node.left, lower, upper, result)
+
+        if node.interval.lower > upper:
+            return
+
+        if node.interval.upper >= lower:
+            result.append(node.interval)
+
+        node = node.right
+
+
+class IntervalIndex(object):
+    """
+    An index of (possibly overlapping) intervals, which quickly finds
+    the stored intervals overlapping a value or another interval.
+
+    Intervals are kept in a randomized search tree (treap) ordered by
+    their lower bounds, where every node also knows the greatest upper
+    bound in its subtree, so subtrees which can't overlap the query
+    are skipped.
+    Intervals are stored as they are, including their data.
+
+    >>> index = IntervalIndex([
+    ...     Interval.closed(0, 10, 'a'),
+    ...     Interval.open(2, 4, 'b'),
+    ...     Interval.closed(4, 6, 'c'),
+    ...     Interval.closed(12, 14, 'd'),
+    ... ])
+    >>> len(index)
+    4
+
+    >>> index.containing(4)
+    [<Interval [0, 10]: a>, <Interval [4, 6]: c>]
+    >>> index.containing(11)
+    []
+
+    >>> index.overlapping(Interval.open(6, 12))
+    [<Interval [0, 10]: a>]
+    >>> index.overlapping(Interval.closed(6, 12))
+    [<Interval [0, 10]: a>, <Interval [4, 6]: c>, <Interval [12, 14]: d>]
+
+    Intervals can be added and removed:
+
+    >>> index.add(Interval.closed(11, 12, 'e'))
+    >>> index.remove(Interval.closed(0, 10, 'a'))
+    >>> index.overlapping(Interval.closed(6, 12))
+    [<Interval [4, 6]: c>, <Interval [11, 12]: e>, <Interval [12, 14]: d>]
+
+    >>> index.remove(Interval.closed(0, 10, 'a'))
+    Traceback (most recent call last):
+    ...
+    KeyError: <Interval [0, 10]: a>
+    >>> index.discard(Interval.closed(0, 10, 'a'))
+
+    Priorities of the tree nodes are drawn from a generator owned
+    by the index, the global random state isn't affected:
+
+    >>> import random
+    >>> random.seed(0)
+    >>> expected = random.random()
+    >>> random.seed(0)
+    >>> IntervalIndex([Interval.closed(0, 1), Interval.closed(2, 3)])
+    <IntervalIndex of 2 intervals>
+    >>> random.random() == expected
+    True
+
+    Iterating over the index returns intervals sorted by lower bounds:
+
+    >>> list(index)
+    [<Interval (2, 4): b>,
+     <Interval [4, 6]: c>,
+     <Interval [11, 12]: e>,
+     <Interval [12, 14]: d>]
+    """
+
+    def __init__(self, intervals=()):
+        self._root = None
+        self._size = 0
+        # a private generator, so that adding intervals doesn't change
+        # the state of the global one
+        self._random = random.Random()
+
+        for interval in intervals:
+            self.add(interval)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        stack = []
+        node = self._root
+
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node.interval
+                node = node.right
+
+    def __repr__(self):
+        return '<{} of {} intervals>'.format(
+            self.__class__.__name__,
+            len(self),
+        )
+
+    def add(self, interval):
+        """
+        Adds the interval to the index.
+        """
+
+        self._root = _insert(
+            self._root, _Node(interval, self._random.random())
+        )
+        self._size += 1
+
+    def _remove(self, interval):
+        self._root, removed = _remove(self._root, interval)
+        if removed:
+            self._size -= 1
+        return removed
+
+    def discard(self, interval):
+        """
+        Removes an interval with the same bounds and data from the index,
+        if there is one.
+        """
+
+        self._remove(interval)
+
+    def remove(self, interval):
+        """
+        Removes an interval with the same bounds and data from the index,
+        raises a KeyError if there isn't one.
+        """
+
+        if not self._remove(interval):
+            raise KeyError(interval)
+
+    def overlapping(self, interval):
+        """
+        Returns a list of stored intervals overlapping the given interval,
+        sorted by their lower bounds.
+        """
+
+        result = []
+        _search(self._root, interval.lower, interval.upper, result)
+        return result
+
+    def containing(self, value):
+        """
+        Returns a list of stored intervals containing the given value,
+        sorted by their lower bounds.
+        """
+
+        result = []
+        _search(self._root, Bound.ge(value), Bound.le(value), result)
+        return result
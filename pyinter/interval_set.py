@@ -1,8 +1,37 @@
 import itertools
+from bisect import bisect_left, bisect_right
 
+from . import vectorized
+from ._compat import text_type, to_str
+from .bound import Bound
+from .extrema import INFINITY, NEGATIVE_INFINITY
+from .instrumentation import instrumented
 # Interval is used in doctests
-from .interval import Interval, set_intersection, difference
+from .interval import Interval, set_intersection, difference, invert
 from .interval import union as _union
+from .interval import _union_sets, _set_bounds, _intersect_pair
+
+
+def _is_sorted(values):
+    return all(values[i] <= values[i + 1] for i in range(len(values) - 1))
+
+
+def _measure(interval):
+    """
+    Returns the length of an interval, INFINITY if it's unbounded.
+
+    >>> _measure(Interval.open(1, 3.5))
+    2.5
+    >>> _measure(Interval(Bound.ge(1), Bound.lt_inf()))
+    inf
+    """
+
+    lower_value = interval.lower.value
+    upper_value = interval.upper.value
+
+    if lower_value is NEGATIVE_INFINITY or upper_value is INFINITY:
+        return INFINITY
+    return upper_value - lower_value
 
 
 class IntervalSet(object):
@@ -26,16 +55,125 @@ class IntervalSet(object):
 
     >>> IntervalSet(intervals, check_overlaps=False)
     <IntervalSet (1, 2), [2, 3], [5, 6]>
+
+    Intervals in the set are kept sorted, which allows membership checks
+    to use a binary search. Sets created with check_overlaps=False are
+    sorted and validated on the first query.
+
+    Structures derived from the intervals, like the complement, are cached
+    until the set is modified, which is tracked with a version counter.
+    That's why the intervals attribute returns a sorted copy of the list
+    of intervals, changing it doesn't affect the set. The attribute can be
+    assigned a new list instead:
+
+    >>> set = IntervalSet([Interval.closed(5, 6), Interval.open(1, 2)])
+    >>> set.intervals == [Interval.open(1, 2), Interval.closed(5, 6)]
+    True
+    >>> set.intervals.append(Interval.closed(2, 4))
+    >>> 3 in set
+    False
+    >>> set.intervals = set.intervals + [Interval.closed(2, 4)]
+    >>> 3 in set, set
+    (True, <IntervalSet (1, 2), [2, 4], [5, 6]>)
     """
 
     def __init__(self, iterable=None, check_overlaps=True):
-        self.intervals = []
+        self._version = 0
+        self._cache = {}
+        self._set_intervals([])
 
         if iterable:
             if check_overlaps:
                 self.update(iterable)
             else:
-                self.intervals.extend(iterable)
+                self._set_intervals(list(iterable))
+
+    @property
+    def intervals(self):
+        """
+        A sorted copy of the list of intervals in the set.
+        """
+
+        self._lower_bounds()
+        return list(self._intervals)
+
+    def _interval_tuple(self):
+        # iterated over instead of the list, which can change meanwhile
+        self._lower_bounds()
+        return self._cached('intervals', lambda: tuple(self._intervals))
+
+    @intervals.setter
+    def intervals(self, intervals):
+        self._set_intervals(list(intervals))
+
+    def _set_intervals(self, intervals):
+        """
+        Replaces the intervals with a list owned by the set.
+        """
+
+        self._intervals = intervals
+        self._lowers = None
+        self._uppers = None
+        self._version += 1
+
+    def _cached(self, name, compute):
+        """
+        Returns a value derived from the intervals, calling compute()
+        only if the set was modified since the value was cached.
+        """
+
+        version, value = self._cache.get(name, (None, None))
+        if version != self._version:
+            value = compute()
+            self._cache[name] = (self._version, value)
+        return value
+
+    def _bound_list(self):
+        """
+        Returns a cached, sorted list of (bound, owner_interval) tuples,
+        used by the sweeps instead of sorting the bounds every time.
+        """
+
+        return self._cached('bounds', lambda: _set_bounds(self._intervals))
+
+    def _lower_bounds(self):
+        """
+        Sorts the intervals (if necessary) and returns a list of their lower
+        bounds, which can be bisected to find intervals.
+        A list of upper bounds is stored in self._uppers.
+        Returns False if the intervals overlap, in which case the set
+        has to be searched linearly.
+
+        >>> IntervalSet([
+        ...     Interval.closed(5, 6),
+        ...     Interval.open(1, 2),
+        ... ], check_overlaps=False)._lower_bounds()
+        [<Bound (1>, <Bound [5>]
+
+        >>> IntervalSet([
+        ...     Interval.closed(1, 3),
+        ...     Interval.closed(2, 4),
+        ... ], check_overlaps=False)._lower_bounds()
+        False
+        """
+
+        lowers = self._lowers
+
+        if lowers is None:
+            intervals = self._intervals
+            intervals.sort()
+            lowers = [interval.lower for interval in intervals]
+
+            for index in range(1, len(intervals)):
+                if intervals[index - 1].upper >= lowers[index]:
+                    lowers = False
+                    break
+
+            self._lowers = lowers
+            if lowers is not False:
+                self._uppers = [interval.upper for interval in intervals]
+
+        return lowers
 
     def __contains__(self, item):
         """
@@ -53,20 +191,94 @@ class IntervalSet(object):
         False
         >>> Interval.open(1, 4) in set
         False
+
+        >>> set = IntervalSet([
+        ...     Interval.closed(4, 6),
+        ...     Interval.open(0, 2),
+        ...     Interval.closed(2, 3),
+        ... ], check_overlaps=False)
+        >>> [i in set for i in range(8)]
+        [False, True, True, True, True, True, True, False]
+        >>> Interval.closed(2, 3) in set
+        True
+
+        >>> set = IntervalSet([
+        ...     Interval.closed(0, 10),
+        ...     Interval.closed(2, 3),
+        ... ], check_overlaps=False)
+        >>> [i in set for i in (1, 5, 11)]
+        [True, True, False]
         """
-        for interval in self:
-            if item in interval:
-                return True
-        return False
+
+        lowers = self._lower_bounds()
+
+        if lowers is False:
+            for interval in self:
+                if item in interval:
+                    return True
+            return False
+
+        if isinstance(item, Interval):
+            key = item.lower
+        else:
+            # the last interval starting at or before the value
+            key = Bound.le(item)
+
+        index = bisect_right(lowers, key) - 1
+        return index >= 0 and item in self._intervals[index]
+
+    def contains_many(self, values):
+        """
+        Checks which of the values are inside the set and returns a list
+        of booleans. Sorted values are matched against the intervals in
+        a single pass, otherwise each value is looked up separately.
+
+        >>> set = Interval.open(0, 2) | Interval.closed(3, 4)
+        >>> set.contains_many(range(6))
+        [False, True, False, True, True, False]
+        >>> set.contains_many([4, 1, 5, 3, 2])
+        [True, True, False, True, False]
+        >>> IntervalSet().contains_many([1, 2])
+        [False, False]
+        """
+
+        values = list(values)
+
+        if self._lower_bounds() is False or not _is_sorted(values):
+            return [value in self for value in values]
+
+        mask = []
+        position = 0
+        total = len(values)
+
+        for interval in self._intervals:
+            lower_operator = interval.lower.operator
+            lower_value = interval.lower.value
+            upper_operator = interval.upper.operator
+            upper_value = interval.upper.value
+
+            # values below the upper bound are either in this interval
+            # or in the gap before it
+            while (
+                position < total
+                and upper_operator(values[position], upper_value)
+            ):
+                mask.append(lower_operator(values[position], lower_value))
+                position += 1
+
+        mask.extend([False] * (total - position))
+        return mask
 
     def __repr__(self):
         return '<{} {}>'.format(self.__class__.__name__, str(self))
 
     def __unicode__(self):
-        return u', '.join(unicode(interval) for interval in sorted(self))
+        # sorts the intervals in place, only if they aren't sorted yet
+        self._lower_bounds()
+        return u', '.join(text_type(interval) for interval in self._intervals)
 
     def __str__(self):
-        return unicode(self).encode('utf-8')
+        return to_str(self.__unicode__())
 
     def __and__(self, other):
         return self.intersection(other)
@@ -81,13 +293,313 @@ class IntervalSet(object):
         return self.difference(other)
 
     def __iter__(self):
-        return iter(self.intervals)
+        return iter(self._interval_tuple())
 
     def __eq__(self, other):
         if isinstance(other, IntervalSet):
-            return self.intervals == other.intervals
+            # make sure both sets are sorted
+            self._lower_bounds()
+            other._lower_bounds()
+            return self._intervals == other._intervals
         return False
 
+    def __ne__(self, other):
+        return not self == other
+
+    def complement(self):
+        """
+        Returns an IntervalSet of values outside of the intervals in this set.
+        The complement is cached until the set is modified.
+
+        >>> set = Interval.closed(0, 1) | Interval.open(2, 3, 'data')
+        >>> set.complement()
+        <IntervalSet (-inf, 0), (1, 2], [3, inf)>
+        >>> set.complement() | set
+        <IntervalSet (-inf, 2], (2, 3): data, [3, inf)>
+
+        >>> set.complement() is set.complement()
+        False
+        >>> set.add(Interval.closed(1, 2))
+        >>> set.complement()
+        <IntervalSet (-inf, 0), [3, inf)>
+        >>> IntervalSet().complement()
+        <IntervalSet (-inf, inf)>
+        """
+
+        complement = self._cached(
+            'complement', lambda: invert(*self._intervals)
+        )
+        return self.__class__(list(complement), check_overlaps=False)
+
+    def _measure_index(self):
+        """
+        Returns a cached (intervals, lowers, uppers, prefix) tuple of
+        the sorted, non-overlapping intervals of the set (joined if they
+        overlap), their lower and upper bounds and prefix sums of their
+        lengths, where prefix[i] is the length of the first i intervals.
+        Unbounded lengths, which only the first and the last interval
+        can have, are left out of the sums.
+        """
+
+        return self._cached('measures', self._compute_measure_index)
+
+    def _compute_measure_index(self):
+        if self._lower_bounds() is False:
+            intervals = _union(*self._intervals, ignore_data=True)
+        else:
+            intervals = self._intervals
+
+        lengths = [_measure(interval) for interval in intervals]
+
+        # zero of the type of the lengths, eg. timedelta(0) for datetimes
+        total = 0
+        for value in itertools.chain.from_iterable(
+            (interval.lower.value, interval.upper.value)
+            for interval in intervals[:1] + intervals[-1:]
+        ):
+            if value is not NEGATIVE_INFINITY and value is not INFINITY:
+                total = value - value
+                break
+
+        prefix = [total]
+        for length in lengths:
+            if length is not INFINITY:
+                total += length
+            prefix.append(total)
+
+        return (
+            intervals,
+            [interval.lower for interval in intervals],
+            [interval.upper for interval in intervals],
+            prefix,
+        )
+
+    def measure(self):
+        """
+        Returns the total length of the intervals in the set,
+        INFINITY if any of them is unbounded. Lengths are summed once
+        and cached until the set is modified.
+
+        >>> set = IntervalSet([Interval.closed(0, 2), Interval.open(5, 5.5)])
+        >>> set.measure()
+        2.5
+        >>> IntervalSet().measure()
+        0
+        >>> IntervalSet([Interval(Bound.gt(0), Bound.lt_inf())]).measure()
+        inf
+
+        >>> from datetime import datetime
+        >>> IntervalSet([
+        ...     Interval.closed(datetime(2020, 1, 1), datetime(2020, 1, 2)),
+        ...     Interval.closed(datetime(2020, 1, 5), datetime(2020, 1, 7)),
+        ... ]).measure().days
+        3
+        """
+
+        intervals, _, _, prefix = self._measure_index()
+
+        if intervals and (
+            intervals[0].lower.value is NEGATIVE_INFINITY
+            or intervals[-1].upper.value is INFINITY
+        ):
+            return INFINITY
+
+        return prefix[-1]
+
+    def measure_within(self, interval):
+        """
+        Returns the total length of the parts of the set inside
+        the interval, without calculating the intersection. Intervals
+        partially inside are found with a binary search, the lengths of
+        the ones between them are taken from cached prefix sums.
+
+        >>> set = IntervalSet([
+        ...     Interval.closed(0, 2),
+        ...     Interval.closed(4, 6),
+        ...     Interval.closed(8, 10),
+        ... ])
+        >>> set.measure_within(Interval.closed(1, 9))
+        4
+        >>> set.measure_within(Interval.open(6, 8))
+        0
+        >>> set.measure_within(Interval(Bound.gt_ninf(), Bound.le(5)))
+        3
+        >>> IntervalSet([
+        ...     Interval(Bound.ge(0), Bound.lt_inf()),
+        ... ]).measure_within(Interval.closed(3, 4))
+        1
+        """
+
+        intervals, lowers, uppers, prefix = self._measure_index()
+
+        # intervals ending before the lower bound
+        # or starting after the upper one are outside of it
+        start = bisect_left(uppers, interval.lower)
+        end = bisect_right(lowers, interval.upper)
+
+        if start >= end:
+            return prefix[0]
+
+        first = _measure(_intersect_pair(intervals[start], interval, True))
+        if start == end - 1:
+            return first
+
+        last = _measure(_intersect_pair(intervals[end - 1], interval, True))
+        if first is INFINITY or last is INFINITY:
+            return INFINITY
+
+        return first + (prefix[end - 1] - prefix[start + 1]) + last
+
+    def _bounded_measure_index(self):
+        index = self._measure_index()
+        intervals = index[0]
+        if intervals and intervals[0].lower.value is NEGATIVE_INFINITY:
+            raise ValueError(
+                'Covered measure can\'t be ranked in a set unbounded below'
+            )
+        return index
+
+    def rank(self, value):
+        """
+        Returns the length of the set covered below the value, found with
+        a binary search and the cached prefix sums of interval lengths.
+        Raises a ValueError if the set is unbounded below.
+
+        >>> set = IntervalSet([Interval.closed(0, 2), Interval.open(5, 10)])
+        >>> [set.rank(value) for value in (-1, 1, 3, 5, 7, 12)]
+        [0, 1, 2, 2, 4, 7]
+        >>> IntervalSet([Interval(Bound.gt_ninf(), Bound.lt(0))]).rank(1)
+        Traceback (most recent call last):
+        ...
+        ValueError: Covered measure can't be ranked in a set unbounded below
+        """
+
+        intervals, lowers, _, prefix = self._bounded_measure_index()
+
+        # the last interval starting at or before the value
+        index = bisect_right(lowers, Bound.le(value)) - 1
+        if index < 0:
+            return prefix[0]
+
+        interval = intervals[index]
+        if value < interval.upper.value:
+            return prefix[index] + (value - interval.lower.value)
+        return prefix[index + 1]
+
+    def select(self, measure):
+        """
+        Returns the value, below which the set covers the given length,
+        the inverse of :meth:`rank`. Raises a ValueError if the measure is
+        negative or larger than the measure of the set, or the set is
+        unbounded below.
+
+        >>> set = IntervalSet([Interval.closed(0, 2), Interval.open(5, 10)])
+        >>> [set.select(measure) for measure in (0, 1, 2, 2.5, 7)]
+        [0, 1, 2, 5.5, 10]
+        >>> set.select(8)
+        Traceback (most recent call last):
+        ...
+        ValueError: The set covers less than 8
+        """
+
+        intervals, _, _, prefix = self._bounded_measure_index()
+
+        if measure < prefix[0]:
+            raise ValueError('Measure can\'t be negative: {}'.format(measure))
+
+        # the first interval, which covers the measure along with
+        # the ones before it
+        index = bisect_left(prefix, measure, 1) - 1
+        if index == len(intervals):
+            if not intervals or intervals[-1].upper.value is not INFINITY:
+                raise ValueError(
+                    'The set covers less than {}'.format(measure)
+                )
+            index -= 1
+
+        return intervals[index].lower.value + (measure - prefix[index])
+
+    def measure_between(self, lower_value, upper_value):
+        """
+        Returns the length of the set covered between two values, which is
+        the difference of their ranks if the set is bounded below.
+
+        >>> set = IntervalSet([Interval.closed(0, 2), Interval.open(5, 10)])
+        >>> set.measure_between(1, 6)
+        2
+        >>> IntervalSet([
+        ...     Interval(Bound.gt_ninf(), Bound.lt(0)),
+        ... ]).measure_between(-3, 1)
+        3
+        """
+
+        intervals = self._measure_index()[0]
+        if intervals and intervals[0].lower.value is NEGATIVE_INFINITY:
+            return self.measure_within(
+                Interval.closed(lower_value, upper_value)
+            )
+
+        return self.rank(upper_value) - self.rank(lower_value)
+
+    def gaps(self):
+        """
+        Returns an IntervalSet of the gaps between the intervals in the set,
+        which unlike the complement doesn't include the unbounded parts
+        before the first and after the last interval.
+
+        >>> set = IntervalSet([
+        ...     Interval.closed(0, 2),
+        ...     Interval.closed_open(4, 6, 'a'),
+        ...     Interval.closed(6, 7, 'b'),
+        ...     Interval.closed(10, 11),
+        ... ])
+        >>> set.gaps()
+        <IntervalSet (2, 4), (7, 10)>
+        >>> max(set.gaps(), key=_measure)
+        <Interval (7, 10)>
+        >>> IntervalSet([Interval.closed(0, 2)]).gaps()
+        <IntervalSet >
+        """
+
+        def compute():
+            intervals = self._measure_index()[0]
+            return [
+                Interval(~previous.upper, ~interval.lower)
+                for previous, interval in zip(intervals, intervals[1:])
+                if not previous.upper.is_opposite_of(interval.lower)
+            ]
+
+        return self.__class__(
+            list(self._cached('gaps', compute)), check_overlaps=False
+        )
+
+    def coverage_histogram(self, bins):
+        """
+        Returns the length of the set covered by each of the bins, given
+        as a sorted sequence of edges, eg. [0, 10, 20] stands for bins
+        [0, 10) and [10, 20).
+
+        >>> set = IntervalSet([Interval.closed(2, 6), Interval.open(9, 15)])
+        >>> set.coverage_histogram([0, 5, 10, 15, 20])
+        [3, 2, 5, 0]
+        >>> set.coverage_histogram([])
+        []
+        """
+
+        bins = list(bins)
+        return [
+            self.measure_within(Interval.closed_open(lower, upper))
+            for lower, upper in zip(bins, bins[1:])
+        ]
+
+    def lazy(self):
+        """
+        Returns a :class:`~pyinter.lazy.LazyIntervalSet` wrapping this set,
+        which defers operations until the result is needed.
+        """
+        from .lazy import LazyIntervalSet
+        return LazyIntervalSet(self)
+
     def _iter_other_sets(self, others):
         for other in others:
             yield (other, ) if isinstance(other, Interval) else other
@@ -100,6 +612,63 @@ class IntervalSet(object):
                 for interval in other:
                     yield interval
 
+    def _iter_other_lists(self, others):
+        # interval sets are passed as they are, to reuse their cached bounds
+        for other in self._iter_other_sets(others):
+            yield other if isinstance(other, IntervalSet) else list(other)
+
+    def _splice(self, start, end, intervals):
+        """
+        Replaces intervals between start and end indices with new ones,
+        keeping the bound lists up to date.
+        """
+
+        self._intervals[start:end] = intervals
+        self._lowers[start:end] = [interval.lower for interval in intervals]
+        self._uppers[start:end] = [interval.upper for interval in intervals]
+        self._version += 1
+
+    def _intersect_intervals(self, others):
+        interval_sets = [self]
+        interval_sets.extend(self._iter_other_lists(others))
+
+        if vectorized.accepts(list(itertools.chain(*interval_sets))):
+            return vectorized.set_intersection(*interval_sets)
+
+        return set_intersection(*interval_sets)
+
+    def _union_intervals(self, others):
+        interval_sets = [self]
+        interval_sets.extend(self._iter_other_lists(others))
+
+        intervals = list(itertools.chain(*interval_sets))
+        if vectorized.accepts(intervals):
+            return vectorized.union(intervals)
+
+        return _union_sets(interval_sets)
+
+    def _subtract_intervals(self, others):
+        subtracting = list(self._iter_other_intervals(others))
+
+        # the sweep needs base intervals which don't overlap
+        base = self
+        base_intervals = self._intervals
+        if self._lower_bounds() is False:
+            base = base_intervals = _union_sets([self])
+
+        if (
+            vectorized.accepts(base_intervals)
+            and vectorized.accepts(subtracting, ignore_data=True)
+        ):
+            return vectorized.difference(base, subtracting)
+
+        if len(others) == 1 and isinstance(others[0], IntervalSet):
+            # reuses the bounds cached by the other set
+            subtracting = others[0]
+
+        return difference(base, subtracting)
+
+    @instrumented('IntervalSet.intersection')
     def intersection(self, *others):
         """
         Returns the intersection between this set and other sets
@@ -118,9 +687,10 @@ class IntervalSet(object):
         <IntervalSet >
         """
 
-        result = set_intersection(self, *self._iter_other_sets(others))
+        result = self._intersect_intervals(others)
         return self.__class__(result, check_overlaps=False)
 
+    @instrumented('IntervalSet.intersection_update', mutation=True)
     def intersection_update(self, *others):
         """
         Updates the set to include only the intersection of itself and others.
@@ -135,9 +705,10 @@ class IntervalSet(object):
         True
         """
 
-        result = set_intersection(self, *self._iter_other_sets(others))
-        self.intervals = result
+        result = self._intersect_intervals(others)
+        self._set_intervals(result)
 
+    @instrumented('IntervalSet.union')
     def union(self, *others):
         """
         Calculates the union of the current set with other sets
@@ -163,13 +734,10 @@ class IntervalSet(object):
         <IntervalSet (1, 10): some>
         """
 
-        intervals = itertools.chain(
-            self,
-            *self._iter_other_sets(others)
-        )
-        result = _union(*intervals)
+        result = self._union_intervals(others)
         return self.__class__(result, check_overlaps=False)
 
+    @instrumented('IntervalSet.update', mutation=True)
     def update(self, *others):
         """
         Updates the set adding new intervals from others (which can be
@@ -185,13 +753,23 @@ class IntervalSet(object):
         True
         """
 
-        intervals = itertools.chain(
-            self,
-            *self._iter_other_sets(others)
-        )
-        result = _union(*intervals)
-        self.intervals = result
+        others = [list(other) for other in self._iter_other_sets(others)]
+        added = sum(len(other) for other in others)
+
+        # adding a few intervals one by one is cheaper
+        # than recalculating the whole set
+        if (
+            added * 8 < len(self._intervals)
+            and self._lower_bounds() is not False
+        ):
+            for interval in itertools.chain(*others):
+                self.add(interval)
+            return
+
+        result = self._union_intervals(others)
+        self._set_intervals(result)
 
+    @instrumented('IntervalSet.difference')
     def difference(self, *others):
         """
         Returns intervals, which are contained in this interval set, but not
@@ -217,11 +795,20 @@ class IntervalSet(object):
         <IntervalSet >
         >>> set_a - (set_b | set_a)
         <IntervalSet >
+
+        Sets created with check_overlaps=False can have overlapping
+        intervals:
+
+        >>> IntervalSet([
+        ...     Interval.closed(0, 5), Interval.closed(2, 8),
+        ... ], check_overlaps=False) - Interval.closed(3, 4)
+        <IntervalSet [0, 3), (4, 8]>
         """
 
-        result = difference(self, self._iter_other_intervals(others))
+        result = self._subtract_intervals(others)
         return self.__class__(result, check_overlaps=False)
 
+    @instrumented('IntervalSet.difference_update', mutation=True)
     def difference_update(self, *others):
         """
         Updates the set removing all intervals which collide with intervals
@@ -240,8 +827,94 @@ class IntervalSet(object):
         <IntervalSet [0, 1], [4, 5): data>
         """
 
-        result = difference(self, self._iter_other_intervals(others))
-        self.intervals = result
+        result = self._subtract_intervals(others)
+        self._set_intervals(result)
 
+    @instrumented('IntervalSet.add', mutation=True)
     def add(self, other):
-        self.update((other, ))
+        """
+        Adds an interval (or intervals of another set) to the set.
+        Only the intervals overlapping or adjacent to the new one
+        are recalculated.
+
+        >>> result = IntervalSet([
+        ...     Interval.closed(0, 1),
+        ...     Interval.closed(3, 4, 'a'),
+        ...     Interval.closed(6, 7),
+        ...     Interval.closed(9, 10),
+        ... ])
+        >>> result.add(Interval.open(4, 6))
+        >>> result
+        <IntervalSet [0, 1], [3, 4]: a, (4, 7], [9, 10]>
+        >>> result.add(Interval.closed(2, 3, 'a'))
+        >>> result
+        <IntervalSet [0, 1], [2, 4]: a, (4, 7], [9, 10]>
+        >>> result.add(Interval.open(5, 8, 'b'))
+        >>> result
+        <IntervalSet [0, 1], [2, 4]: a, (4, 5], (5, 8): b, [9, 10]>
+        >>> result.add(Interval.open(-1, 0))
+        >>> result.add(Interval.closed(11, 12))
+        >>> result
+        <IntervalSet (-1, 1], [2, 4]: a, (4, 5], (5, 8): b, [9, 10],
+                     [11, 12]>
+        >>> result == IntervalSet([
+        ...     Interval.closed(0, 1),
+        ...     Interval.closed(3, 4, 'a'),
+        ...     Interval.closed(6, 7),
+        ...     Interval.closed(9, 10),
+        ...     Interval.open(4, 6),
+        ...     Interval.closed(2, 3, 'a'),
+        ...     Interval.open(5, 8, 'b'),
+        ...     Interval.open(-1, 0),
+        ...     Interval.closed(11, 12),
+        ... ])
+        True
+        """
+
+        if not isinstance(other, Interval) or self._lower_bounds() is False:
+            self.update((other, ))
+            return
+
+        # intervals with upper bounds from right before the new lower bound
+        # and lower bounds up to right after the new upper bound
+        start = bisect_left(self._uppers, ~other.lower)
+        end = bisect_right(self._lowers, ~other.upper)
+
+        affected = self._intervals[start:end]
+        affected.append(other)
+        self._splice(start, end, _union(*affected))
+
+    @instrumented('IntervalSet.discard', mutation=True)
+    def discard(self, other):
+        """
+        Removes all values of an interval (or intervals of another set)
+        from the set.
+        Only the intervals overlapping the removed one are recalculated.
+
+        >>> result = IntervalSet([
+        ...     Interval.closed(0, 2),
+        ...     Interval.closed(3, 5, 'a'),
+        ...     Interval.closed(6, 8),
+        ... ])
+        >>> result.discard(Interval.open(1, 4))
+        >>> result
+        <IntervalSet [0, 1], [4, 5]: a, [6, 8]>
+        >>> result.discard(Interval.closed(7, 10))
+        >>> result.discard(Interval.closed(-2, -1))
+        >>> result
+        <IntervalSet [0, 1], [4, 5]: a, [6, 7)>
+        >>> result.discard(IntervalSet([Interval.closed(0, 6)]))
+        >>> result
+        <IntervalSet (6, 7)>
+        """
+
+        if not isinstance(other, Interval) or self._lower_bounds() is False:
+            self.difference_update(other)
+            return
+
+        start = bisect_left(self._uppers, other.lower)
+        end = bisect_right(self._lowers, other.upper)
+
+        self._splice(
+            start, end, difference(self._intervals[start:end], (other, ))
+        )
@@ -0,0 +1,199 @@
+from .interval import Interval
+from .interval_set import IntervalSet
+
+
+UNION = 'union'
+INTERSECTION = 'intersection'
+DIFFERENCE = 'difference'
+
+OPERATOR_SYMBOLS = {
+    UNION: '|',
+    INTERSECTION: '&',
+    DIFFERENCE: '-',
+}
+
+
+def lazy(item):
+    """
+    Wraps an IntervalSet or an Interval in a :class:`LazyIntervalSet`.
+    """
+
+    if isinstance(item, LazyIntervalSet):
+        return item
+    return LazyIntervalSet(item)
+
+
+class LazyIntervalSet(object):
+    """
+    A deferred IntervalSet expression. Operators build an expression tree
+    instead of calculating intermediate sets, chains of the same operation
+    are flattened, so each of them is calculated in a single sweep over all
+    of its operands. The expression is evaluated when it's iterated over,
+    checked for membership or evaluate() is called, the result is cached
+    until any of the interval sets in the expression is modified.
+
+    >>> a = IntervalSet([Interval.closed(0, 2), Interval.closed(6, 8)])
+    >>> b = Interval.closed(1, 3, 'b')
+    >>> c = IntervalSet([Interval.open(4, 7)])
+    >>> d = Interval.closed(7, 10)
+
+    >>> expression = lazy(a) | b | c | d
+    >>> expression
+    <LazyIntervalSet (set | interval | set | interval)>
+    >>> expression.evaluate()
+    <IntervalSet [0, 1), [1, 3]: b, (4, 10]>
+    >>> expression.evaluate() == a | b | c | d
+    True
+
+    >>> expression = (lazy(a) | b) - c - d & a
+    >>> expression
+    <LazyIntervalSet (((set | interval) - set - interval) & set)>
+    >>> expression == ((a | b) - c - d) & a
+    True
+    >>> list(expression)
+    [<Interval [0, 1)>, <Interval [1, 2]: b>]
+    >>> [value in expression for value in range(8)]
+    [True, True, True, False, False, False, False, False]
+
+    Interval sets and intervals have a lazy() method as well:
+
+    >>> a.lazy() & b
+    <LazyIntervalSet (set & interval)>
+    >>> b.lazy() - a
+    <LazyIntervalSet (interval - set)>
+    >>> (b.lazy() - a).evaluate()
+    <IntervalSet (2, 3]: b>
+    """
+
+    def __init__(self, item):
+        self._operation = None
+        self._operands = (item, )
+        self._result = None
+        self._result_versions = None
+
+    @classmethod
+    def _node(cls, operation, operands):
+        node = cls.__new__(cls)
+        node._operation = operation
+        node._operands = tuple(operands)
+        node._result = None
+        node._result_versions = None
+        return node
+
+    def _combine(self, operation, other):
+        other = lazy(other)
+
+        operands = []
+        if self._operation == operation:
+            operands.extend(self._operands)
+        else:
+            operands.append(self)
+
+        # a - (b - c) can't be flattened, unlike (a - b) - c
+        if other._operation == operation and operation != DIFFERENCE:
+            operands.extend(other._operands)
+        else:
+            operands.append(other)
+
+        return self._node(operation, operands)
+
+    def _value(self):
+        """
+        Returns an IntervalSet or an Interval which can be passed
+        to IntervalSet methods.
+        """
+
+        if self._operation is None:
+            return self._operands[0]
+        return self.evaluate()
+
+    def _versions(self):
+        """
+        Returns a tuple of the versions of the interval sets
+        in the expression, which change when any of them is modified.
+        """
+
+        if self._operation is None:
+            return (getattr(self._operands[0], '_version', None), )
+
+        versions = ()
+        for operand in self._operands:
+            versions += operand._versions()
+        return versions
+
+    def evaluate(self):
+        """
+        Calculates the expression and returns the resulting IntervalSet.
+        The result is cached until any of the sets in the expression
+        is modified.
+
+        >>> a = IntervalSet([Interval.closed(0, 1)])
+        >>> expression = a.lazy() | Interval.closed(5, 6)
+        >>> expression.evaluate()
+        <IntervalSet [0, 1], [5, 6]>
+        >>> expression.evaluate() is expression.evaluate()
+        True
+        >>> a.add(Interval.closed(2, 3))
+        >>> expression.evaluate()
+        <IntervalSet [0, 1], [2, 3], [5, 6]>
+        """
+
+        versions = self._versions()
+        if versions != self._result_versions:
+            self._result = None
+            self._result_versions = versions
+
+        if self._result is None:
+            if self._operation is None:
+                self._result = IntervalSet().union(self._operands[0])
+            else:
+                values = [operand._value() for operand in self._operands]
+
+                first = values[0]
+                if isinstance(first, Interval):
+                    first = IntervalSet((first, ))
+
+                self._result = getattr(first, self._operation)(*values[1:])
+
+        return self._result
+
+    def __and__(self, other):
+        return self._combine(INTERSECTION, other)
+
+    def __or__(self, other):
+        return self._combine(UNION, other)
+
+    def __add__(self, other):
+        return self._combine(UNION, other)
+
+    def __sub__(self, other):
+        return self._combine(DIFFERENCE, other)
+
+    def __iter__(self):
+        return iter(self.evaluate())
+
+    def __contains__(self, item):
+        return item in self.evaluate()
+
+    def __eq__(self, other):
+        if isinstance(other, LazyIntervalSet):
+            other = other.evaluate()
+        return self.evaluate() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def _describe(self):
+        if self._operation is None:
+            if isinstance(self._operands[0], Interval):
+                return 'interval'
+            return 'set'
+
+        return '({})'.format(
+            ' {} '.format(OPERATOR_SYMBOLS[self._operation]).join(
+                operand._describe() for operand in self._operands
+            )
+        )
+
+    def __repr__(self):
+        return '<{} {}>'.format(self.__class__.__name__, self._describe())
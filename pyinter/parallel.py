@@ -0,0 +1,386 @@
+"""
+Partitioned versions of the union, set_intersection and difference sweeps,
+which can use multiple processes for very large inputs.
+
+The value domain is split into ranges at quantiles of the lower bounds,
+intervals are clipped to each of the ranges and every range is swept
+separately, in a concurrent.futures process pool (or a given executor).
+Pieces of the results cut at range boundaries are joined back together
+when their data is the same, so the results are the same as the ones
+of the single process sweeps.
+
+concurrent.futures is a part of the standard library on Python 3
+and is available as the futures backport on Python 2. Without it (or with
+a single partition) the ranges are swept one by one in this process.
+
+>>> intervals = [Interval.closed(value, value + 3) for value in range(20)]
+>>> union(intervals, partitions=4, executor=SerialExecutor())
+[<Interval [0, 22]>]
+"""
+
+import multiprocessing
+from bisect import bisect_right
+
+try:
+    from concurrent import futures
+except ImportError:  # pragma: no cover
+    futures = None
+
+from .bound import Bound
+from .extrema import NEGATIVE_INFINITY
+from .interval import Interval
+from .interval import union as _union
+from .interval import set_intersection as _set_intersection
+from .interval import difference as _difference
+
+
+# below this number of intervals per partition
+# the cost of sending them to other processes isn't worth it
+MIN_PARTITION_SIZE = 10000
+
+# number of lower bounds sampled from each collection to find the ranges
+SAMPLE_SIZE = 10000
+
+
+class SerialExecutor(object):
+    """
+    An executor running everything in the current process, which can be
+    passed instead of a process pool, eg. for debugging.
+    """
+
+    def map(self, function, *iterables):
+        return map(function, *iterables)
+
+
+def _partition_count(partitions, size):
+    if partitions is None:
+        partitions = min(
+            multiprocessing.cpu_count(), size // MIN_PARTITION_SIZE
+        )
+    return max(1, partitions)
+
+
+def _cuts(interval_lists, partitions):
+    """
+    Returns sorted, distinct values splitting the lower bounds of
+    the intervals into (at most) the given number of ranges
+    of a similar size.
+
+    >>> _cuts([[Interval.closed(value, 10) for value in range(8)]], 4)
+    [2, 4, 6]
+    >>> _cuts([[Interval.closed(0, 1)] * 8], 4)
+    []
+    """
+
+    lowers = []
+    for intervals in interval_lists:
+        step = max(1, len(intervals) // SAMPLE_SIZE)
+        lowers.extend(
+            interval.lower.value for interval in intervals[::step]
+            if interval.lower.value is not NEGATIVE_INFINITY
+        )
+
+    lowers.sort()
+
+    cuts = []
+    if not lowers:
+        return cuts
+
+    for index in range(1, partitions):
+        value = lowers[index * len(lowers) // partitions]
+        # the first range starts at -inf anyway
+        if (cuts and cuts[-1] < value) or (not cuts and lowers[0] < value):
+            cuts.append(value)
+
+    return cuts
+
+
+def _ranges(cuts):
+    """
+    Returns a (lower, upper) pair of bounds for each of the ranges between
+    cuts, None stands for no bound.
+    """
+
+    lowers = [None] + [Bound.ge(cut) for cut in cuts]
+    uppers = [Bound.lt(cut) for cut in cuts] + [None]
+    return list(zip(lowers, uppers))
+
+
+def _partition(intervals, cuts):
+    """
+    Splits the intervals into lists of intervals overlapping
+    each of the ranges between cuts.
+    """
+
+    partitions = [[] for _ in range(len(cuts) + 1)]
+
+    for interval in intervals:
+        first = bisect_right(cuts, interval.lower.value)
+        last = bisect_right(cuts, interval.upper.value)
+        for index in range(first, last + 1):
+            partitions[index].append(interval)
+
+    return partitions
+
+
+def _clip(intervals, lower, upper):
+    """
+    Returns the parts of intervals between the lower and upper bounds.
+
+    >>> _clip(
+    ...     [Interval.closed(0, 2, 'a'), Interval.open(3, 4),
+    ...      Interval.closed(4, 5)],
+    ...     Bound.ge(1), Bound.lt(4),
+    ... )
+    [<Interval [1, 2]: a>, <Interval (3, 4)>]
+    """
+
+    clipped = []
+
+    for interval in intervals:
+        interval_lower = interval.lower
+        interval_upper = interval.upper
+
+        if lower is not None and interval_lower < lower:
+            interval_lower = lower
+        if upper is not None and upper < interval_upper:
+            interval_upper = upper
+
+        if interval_lower > interval_upper:
+            continue
+
+        if (
+            interval_lower is interval.lower
+            and interval_upper is interval.upper
+        ):
+            clipped.append(interval)
+        else:
+            clipped.append(Interval(
+                interval_lower, interval_upper, data_set=interval.data
+            ))
+
+    return clipped
+
+
+def _ends_at(interval_lists, upper):
+    """
+    Checks whether any of the intervals ends right at the upper bound
+    of a range, in which case the sweeps split their results there as well.
+    """
+
+    if upper is None:
+        return False
+
+    return any(
+        interval.upper == upper
+        for intervals in interval_lists
+        for interval in intervals
+    )
+
+
+def _stitch(results):
+    """
+    Concatenates the results of the ranges, given as (intervals, split)
+    tuples, joining intervals cut at range boundaries which have the same
+    data, unless split is set for the range on the left.
+
+    >>> _stitch([
+    ...     ([Interval.closed(0, 1), Interval.closed_open(2, 4, 'a')], False),
+    ...     ([Interval.closed(4, 5, 'a')], False),
+    ...     ([], False),
+    ...     ([Interval.closed_open(6, 7, 'b')], True),
+    ...     ([Interval.closed(7, 8, 'b')], False),
+    ... ])
+    [<Interval [0, 1]>,
+     <Interval [2, 5]: a>,
+     <Interval [6, 7): b>,
+     <Interval [7, 8]: b>]
+    """
+
+    stitched = []
+    split = False
+
+    for result, next_split in results:
+        if stitched and result and not split:
+            last = stitched[-1]
+            first = result[0]
+
+            if (
+                last.upper.is_opposite_of(first.lower)
+                and last.data == first.data
+            ):
+                stitched[-1] = Interval(
+                    last.lower, first.upper, data_set=last.data
+                )
+                result = result[1:]
+
+        stitched.extend(result)
+        split = next_split
+
+    return stitched
+
+
+def _map(function, tasks, executor):
+    if executor is not None:
+        return list(executor.map(function, tasks))
+
+    if futures is None or len(tasks) == 1:
+        return [function(task) for task in tasks]
+
+    with futures.ProcessPoolExecutor(max_workers=len(tasks)) as pool:
+        return list(pool.map(function, tasks))
+
+
+# range functions return a tuple of (result, split), see _stitch
+
+def _union_range(task):
+    intervals, lower, upper, ignore_data = task
+    # union always joins adjacent intervals with the same data
+    return (
+        _union(*_clip(intervals, lower, upper), ignore_data=ignore_data),
+        False,
+    )
+
+
+def _set_intersection_range(task):
+    interval_sets, lower, upper, ignore_data = task
+    result = _set_intersection(
+        *[_clip(intervals, lower, upper) for intervals in interval_sets],
+        ignore_data=ignore_data
+    )
+    return result, _ends_at(interval_sets, upper)
+
+
+def _difference_range(task):
+    base_intervals, subtracting_intervals, lower, upper = task
+    result = _difference(
+        _clip(base_intervals, lower, upper),
+        _clip(subtracting_intervals, lower, upper),
+    )
+    return result, _ends_at((base_intervals, ), upper)
+
+
+def union(intervals, ignore_data=False, partitions=None, executor=None):
+    """
+    Returns the union of a collection of intervals,
+    like :func:`pyinter.union`.
+
+    The intervals are split into (at most) the given number of partitions.
+    By default there is one partition per CPU, as long as each of them gets
+    at least MIN_PARTITION_SIZE intervals. Partitions are processed by
+    the executor, or a new process pool if there is none.
+
+    >>> intervals = [
+    ...     Interval.closed(0, 3, 'a'),
+    ...     Interval.closed(2, 8, 'a'),
+    ...     Interval.closed(5, 11, 'b'),
+    ...     Interval.closed(13, 21, 'a'),
+    ...     Interval.closed(16, 19, 'a'),
+    ...     Interval.closed(16, 24, 'b'),
+    ... ]
+    >>> result = union(intervals, partitions=3, executor=SerialExecutor())
+    >>> result == union(intervals) == _union(*intervals)
+    True
+    >>> result
+    [<Interval [0, 5): a>,
+     <Interval [5, 8]: a, b>,
+     <Interval (8, 11]: b>,
+     <Interval [13, 16): a>,
+     <Interval [16, 21]: a, b>,
+     <Interval (21, 24]: b>]
+    """
+
+    intervals = list(intervals)
+    partitions = _partition_count(partitions, len(intervals))
+
+    if executor is None and partitions == 1:
+        return _union(*intervals, ignore_data=ignore_data)
+
+    cuts = _cuts([intervals], partitions)
+    tasks = [
+        (part, lower, upper, ignore_data)
+        for part, (lower, upper) in zip(
+            _partition(intervals, cuts), _ranges(cuts)
+        )
+    ]
+
+    return _stitch(_map(_union_range, tasks, executor))
+
+
+def set_intersection(interval_sets, ignore_data=False, partitions=None,
+                     executor=None):
+    """
+    Returns the intersection of a list of interval sets,
+    like :func:`pyinter.set_intersection`.
+    See :func:`union` for the description of partitions and executor.
+
+    >>> interval_sets = [
+    ...     [Interval.closed(0, 3), Interval.closed(5, 8),
+    ...      Interval.closed(14, 18)],
+    ...     [Interval.closed(4, 8, 'a'), Interval.closed(11, 16, 'b')],
+    ...     [Interval.closed(2, 17)],
+    ... ]
+    >>> set_intersection(
+    ...     interval_sets, partitions=3, executor=SerialExecutor()
+    ... )
+    [<Interval [5, 8]: a>, <Interval [14, 16]: b>]
+    """
+
+    interval_sets = [list(intervals) for intervals in interval_sets]
+    partitions = _partition_count(
+        partitions, sum(len(intervals) for intervals in interval_sets)
+    )
+
+    if executor is None and partitions == 1:
+        return _set_intersection(*interval_sets, ignore_data=ignore_data)
+
+    cuts = _cuts(interval_sets, partitions)
+    parts = zip(*[
+        _partition(intervals, cuts) for intervals in interval_sets
+    ])
+    tasks = [
+        (part, lower, upper, ignore_data)
+        for part, (lower, upper) in zip(parts, _ranges(cuts))
+    ]
+
+    return _stitch(_map(_set_intersection_range, tasks, executor))
+
+
+def difference(base_intervals, subtracting_intervals, partitions=None,
+               executor=None):
+    """
+    Returns the parts of base intervals, which aren't covered by any
+    of the subtracting intervals, like :func:`pyinter.difference`.
+    See :func:`union` for the description of partitions and executor.
+
+    >>> difference(
+    ...   [Interval.closed(0, 5, 'a'), Interval.closed(8, 12, 'b'),
+    ...    Interval.closed(15, 18, 'c')],
+    ...   [Interval.closed(2, 4), Interval.closed(7, 9),
+    ...    Interval.closed(12, 18)],
+    ...   partitions=3,
+    ...   executor=SerialExecutor(),
+    ... )
+    [<Interval [0, 2): a>, <Interval (4, 5]: a>, <Interval (9, 12): b>]
+    """
+
+    base_intervals = list(base_intervals)
+    subtracting_intervals = list(subtracting_intervals)
+    partitions = _partition_count(
+        partitions, len(base_intervals) + len(subtracting_intervals)
+    )
+
+    if executor is None and partitions == 1:
+        return _difference(base_intervals, subtracting_intervals)
+
+    cuts = _cuts([base_intervals, subtracting_intervals], partitions)
+    tasks = [
+        (base_part, subtracting_part, lower, upper)
+        for base_part, subtracting_part, (lower, upper) in zip(
+            _partition(base_intervals, cuts),
+            _partition(subtracting_intervals, cuts),
+            _ranges(cuts),
+        )
+    ]
+
+    return _stitch(_map(_difference_range, tasks, executor))
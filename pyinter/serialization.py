@@ -0,0 +1,680 @@
+"""
+A compact binary format for interval sets with numeric, date
+or datetime bounds.
+
+The format starts with a fixed size header (see HEADER), followed by
+packed columns of lower and upper bound values, a byte of flags for
+each interval (whether its bounds are closed or infinite) and an index
+into the table of distinct data sets for each interval. The data table
+is stored as JSON and comes last, so data items can be strings, numbers,
+booleans, None or tuples of them. Loading a set never executes code
+from the input.
+
+Values are stored as little-endian 64 bit integers or floats, dates as
+days since 0001-01-01 and datetimes (without time zones) as microseconds
+since 1970-01-01. Infinite bounds are flagged and stored as the lowest
+or highest value of the column, which keeps the columns sorted.
+Bound values which would be changed by storing them (eg. Fractions,
+or integers in a column of floats, which don't fit 53 bits) are rejected
+with a TypeError.
+
+>>> from datetime import datetime
+>>> interval_set = IntervalSet([
+...     Interval.closed(1, 2, 'a'),
+...     Interval.open(3, 4),
+...     Interval(Bound.ge(5), Bound.lt_inf(), 'a'),
+... ])
+>>> loads(dumps(interval_set))
+<IntervalSet [1, 2]: a, (3, 4), [5, inf): a>
+>>> loads(dumps(interval_set)) == interval_set
+True
+
+>>> loads(dumps(Interval.closed(datetime(2020, 1, 1), datetime(2020, 1, 2))))
+<IntervalSet [2020-01-01 00:00:00, 2020-01-02 00:00:00]>
+>>> loads(dumps([Interval.open(0.5, 1.5)]))
+<IntervalSet (0.5, 1.5)>
+>>> loads(dumps(IntervalSet()))
+<IntervalSet >
+>>> dumps([Interval.closed(0, 1, object)])
+Traceback (most recent call last):
+...
+TypeError: Unsupported data item: <class 'object'>
+>>> dumps([Interval.closed(2 ** 64, 2 ** 64 + 1)])
+Traceback (most recent call last):
+...
+TypeError: Bound value 18446744073709551617 can't be stored exactly
+
+Saved sets can be memory mapped and queried without loading them,
+see :func:`load_mmap`.
+"""
+
+import json
+import mmap
+import numbers
+import operator
+import struct
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+
+from ._compat import PY2, text_type
+from .bound import Bound
+from .extrema import INFINITY, NEGATIVE_INFINITY
+from .interval import Interval, union, _is_normalized
+from .interval_set import IntervalSet
+
+
+MAGIC = b'PYIS'
+VERSION = 2
+
+# magic, version, value type, number of intervals, size of the data table
+HEADER = struct.Struct('<4sBcxxQQ')
+
+INTEGER = b'q'
+FLOAT = b'd'
+DATE = b'E'
+DATETIME = b'M'
+
+LOWER_CLOSED = 1
+UPPER_CLOSED = 2
+LOWER_INFINITE = 4
+UPPER_INFINITE = 8
+
+DATA_INDEX = 'I'
+
+# types of data items, which can be stored in the JSON data table
+# (as well as tuples of them)
+DATA_TYPES = (text_type, str, int, float, type(None))
+if PY2:
+    DATA_TYPES += (long, )  # noqa: F821
+
+_EPOCH = datetime(1970, 1, 1)
+_DATE_ORIGIN = date(1, 1, 1).toordinal()
+
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _encode_datetime(value):
+    if value.tzinfo is not None:
+        raise TypeError(
+            'Datetimes with time zones are not supported, got {!r}'
+            .format(value)
+        )
+    delta = value - _EPOCH
+    return (
+        (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+    )
+
+
+def _decode_datetime(value):
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _encode_date(value):
+    return value.toordinal() - _DATE_ORIGIN
+
+
+def _decode_date(value):
+    return date.fromordinal(value + _DATE_ORIGIN)
+
+
+def _identity(value):
+    return value
+
+
+class _Codec(object):
+    """
+    Describes how values of a type are stored.
+    """
+
+    def __init__(self, value_format, encode, decode, lowest, highest):
+        self.format = value_format
+        self.encode = encode
+        self.decode = decode
+        # stored in place of infinite bounds
+        self.lowest = lowest
+        self.highest = highest
+
+
+CODECS = {
+    INTEGER: _Codec('q', _identity, _identity, _INT64_MIN, _INT64_MAX),
+    FLOAT: _Codec(
+        'd', _identity, _identity, float('-inf'), float('inf')
+    ),
+    DATE: _Codec('q', _encode_date, _decode_date, _INT64_MIN, _INT64_MAX),
+    DATETIME: _Codec(
+        'q', _encode_datetime, _decode_datetime, _INT64_MIN, _INT64_MAX
+    ),
+}
+
+
+def _is_integer(value):
+    return (
+        isinstance(value, numbers.Integral)
+        and _INT64_MIN <= value <= _INT64_MAX
+    )
+
+
+def _is_float(value):
+    """
+    Checks whether a number is stored as a float without changing it.
+    """
+
+    if isinstance(value, float):
+        return True
+    try:
+        return float(value) == value
+    except OverflowError:
+        return False
+
+
+def _inexact_error(value):
+    return TypeError(
+        'Bound value {!r} can\'t be stored exactly'.format(value)
+    )
+
+
+def _value_type(values):
+    """
+    Returns the type of values, which can store all of the given values
+    exactly.
+
+    >>> _value_type([1, 2]) == INTEGER
+    True
+    >>> _value_type([1, 2.5]) == FLOAT
+    True
+    >>> _value_type([2 ** 64]) == FLOAT
+    True
+    >>> _value_type(['a'])
+    Traceback (most recent call last):
+    ...
+    TypeError: Unsupported bound value: 'a'
+
+    Numbers which would be rounded by storing them as floats
+    are rejected:
+
+    >>> from fractions import Fraction
+    >>> _value_type([Fraction(1, 3)])
+    Traceback (most recent call last):
+    ...
+    TypeError: Bound value Fraction(1, 3) can't be stored exactly
+    >>> _value_type([2 ** 64 + 1])
+    Traceback (most recent call last):
+    ...
+    TypeError: Bound value 18446744073709551617 can't be stored exactly
+    >>> _value_type([2 ** 53 + 1, 0.5])
+    Traceback (most recent call last):
+    ...
+    TypeError: Bound value 9007199254740993 can't be stored exactly
+    """
+
+    value_types = set()
+    # the first integer, which would change if the values were floats
+    inexact = None
+
+    for value in values:
+        if isinstance(value, datetime):
+            value_types.add(DATETIME)
+        elif isinstance(value, date):
+            value_types.add(DATE)
+        elif _is_integer(value):
+            value_types.add(INTEGER)
+            if inexact is None and not _is_float(value):
+                inexact = value
+        elif isinstance(value, numbers.Real):
+            if not _is_float(value):
+                raise _inexact_error(value)
+            value_types.add(FLOAT)
+        else:
+            raise TypeError('Unsupported bound value: {!r}'.format(value))
+
+    value_type = _common_type(value_types)
+    if value_type == FLOAT and inexact is not None:
+        raise _inexact_error(inexact)
+
+    return value_type
+
+
+def _common_type(value_types):
+    """
+    Returns the type of values, which can store values of all the types.
+
+    >>> _common_type(set([INTEGER, FLOAT])) == FLOAT
+    True
+    >>> _common_type(set([DATE, FLOAT]))
+    Traceback (most recent call last):
+    ...
+    TypeError: Bound values of different types can't be mixed
+    """
+
+    if value_types <= set((INTEGER, )):
+        return INTEGER
+    if value_types <= set((INTEGER, FLOAT)):
+        return FLOAT
+    if len(value_types) == 1:
+        return next(iter(value_types))
+
+    raise TypeError('Bound values of different types can\'t be mixed')
+
+
+def _finite(value):
+    return value is not INFINITY and value is not NEGATIVE_INFINITY
+
+
+def _encode_value(value, codec):
+    encoded = codec.encode(value)
+    # values of other sets may not fit the column, eg. large integers
+    # written to a file of floats
+    if codec.format == 'd' and not _is_float(encoded):
+        raise _inexact_error(value)
+    return encoded
+
+
+def _encode_interval(interval, codec):
+    """
+    Returns the (flags, lower value, upper value) of an interval
+    as they are stored.
+    """
+
+    lower = interval.lower
+    upper = interval.upper
+    flags = 0
+
+    if lower.operator is operator.ge:
+        flags |= LOWER_CLOSED
+    if upper.operator is operator.le:
+        flags |= UPPER_CLOSED
+
+    if _finite(lower.value):
+        lower_value = _encode_value(lower.value, codec)
+    else:
+        flags |= LOWER_INFINITE
+        lower_value = codec.lowest
+
+    if _finite(upper.value):
+        upper_value = _encode_value(upper.value, codec)
+    else:
+        flags |= UPPER_INFINITE
+        upper_value = codec.highest
+
+    return flags, lower_value, upper_value
+
+
+class _DataTable(object):
+    """
+    The table of distinct data sets of the intervals.
+    """
+
+    def __init__(self):
+        self._table = [()]
+        self._indexes = {frozenset(): 0}
+
+    def index(self, data):
+        """
+        Returns the index of the data set in the table, adding it if needed.
+        """
+
+        data = frozenset(data)
+        index = self._indexes.get(data)
+        if index is None:
+            for item in data:
+                _check_data_item(item)
+            index = self._indexes[data] = len(self._table)
+            self._table.append(tuple(data))
+        return index
+
+    def dumps(self):
+        return json.dumps(self._table, separators=(',', ':')).encode('utf-8')
+
+
+def _check_data_item(item):
+    if isinstance(item, tuple):
+        for value in item:
+            _check_data_item(value)
+    elif not isinstance(item, DATA_TYPES):
+        raise TypeError('Unsupported data item: {!r}'.format(item))
+
+
+def _to_tuples(value):
+    # JSON arrays in data items can only come from tuples
+    if isinstance(value, list):
+        return tuple(_to_tuples(item) for item in value)
+    return value
+
+
+def _load_data_table(data):
+    """
+    Returns a list of tuples of data items from the JSON data table.
+
+    >>> _load_data_table(b'[[],["a",1,["b",2]]]') == [(), ('a', 1, ('b', 2))]
+    True
+    """
+
+    return [
+        tuple(_to_tuples(item) for item in items)
+        for items in json.loads(data.decode('utf-8'))
+    ]
+
+
+def dumps(intervals):
+    """
+    Returns the binary representation of an IntervalSet, an Interval
+    or a sequence of intervals (which are joined like in an IntervalSet
+    if they overlap).
+    """
+
+    if isinstance(intervals, Interval):
+        intervals = (intervals, )
+
+    intervals = sorted(intervals)
+    if not _is_normalized(intervals):
+        intervals = union(*intervals)
+
+    value_type = _value_type(
+        value for interval in intervals
+        for value in (interval.lower.value, interval.upper.value)
+        if _finite(value)
+    )
+    codec = CODECS[value_type]
+
+    lowers = []
+    uppers = []
+    flags = bytearray()
+    data_indexes = []
+    data_table = _DataTable()
+
+    for interval in intervals:
+        interval_flags, lower, upper = _encode_interval(interval, codec)
+        lowers.append(lower)
+        uppers.append(upper)
+        flags.append(interval_flags)
+        data_indexes.append(data_table.index(interval.data))
+
+    count = len(intervals)
+    column_format = '<{}{}'.format(count, codec.format)
+    data_bytes = data_table.dumps()
+
+    return b''.join((
+        HEADER.pack(MAGIC, VERSION, value_type, count, len(data_bytes)),
+        struct.pack(column_format, *lowers),
+        struct.pack(column_format, *uppers),
+        bytes(flags),
+        struct.pack('<{}{}'.format(count, DATA_INDEX), *data_indexes),
+        data_bytes,
+    ))
+
+
+def dump(intervals, path):
+    """
+    Writes the binary representation of intervals to a file,
+    see :func:`dumps`.
+    """
+
+    with open(path, 'wb') as output:
+        output.write(dumps(intervals))
+
+
+class _Column(object):
+    """
+    A read-only sequence of values packed in a buffer, which can be
+    bisected without unpacking all of them.
+    """
+
+    def __init__(self, buffer, offset, count, value_format):
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+        self._format = value_format
+        self._struct = struct.Struct('<' + value_format)
+
+    def __len__(self):
+        return self._count
+
+    def unpack(self):
+        """
+        Returns a tuple of all the values.
+        """
+
+        return struct.unpack_from(
+            '<{}{}'.format(self._count, self._format),
+            self._buffer,
+            self._offset,
+        )
+
+    def __getitem__(self, index):
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._struct.unpack_from(
+            self._buffer, self._offset + index * self._struct.size
+        )[0]
+
+
+class _Layout(object):
+    """
+    Positions of the columns of serialized intervals in a buffer.
+    """
+
+    def __init__(self, buffer):
+        magic, version, value_type, count, data_size = HEADER.unpack_from(
+            buffer, 0
+        )
+
+        if magic != MAGIC:
+            raise ValueError('Not a serialized interval set')
+        if version != VERSION:
+            raise ValueError('Unsupported version: {}'.format(version))
+
+        self.value_type = value_type
+        self.codec = codec = CODECS[value_type]
+        value_format = codec.format
+        value_size = struct.calcsize(value_format)
+        index_size = struct.calcsize(DATA_INDEX)
+
+        self.count = count
+        offset = HEADER.size
+
+        self.lowers = _Column(buffer, offset, count, value_format)
+        offset += count * value_size
+        self.uppers = _Column(buffer, offset, count, value_format)
+        offset += count * value_size
+        self.flags = _Column(buffer, offset, count, 'B')
+        offset += count
+        self.data_indexes = _Column(buffer, offset, count, DATA_INDEX)
+        offset += count * index_size
+
+        self.data_table = _load_data_table(buffer[offset:offset + data_size])
+
+    def _interval(self, flags, lower_value, upper_value, data_index):
+        decode = self.codec.decode
+
+        if flags & LOWER_INFINITE:
+            lower = Bound.gt_ninf()
+        elif flags & LOWER_CLOSED:
+            lower = Bound.ge(decode(lower_value))
+        else:
+            lower = Bound.gt(decode(lower_value))
+
+        if flags & UPPER_INFINITE:
+            upper = Bound.lt_inf()
+        elif flags & UPPER_CLOSED:
+            upper = Bound.le(decode(upper_value))
+        else:
+            upper = Bound.lt(decode(upper_value))
+
+        return Interval(lower, upper, data_set=self.data_table[data_index])
+
+    def interval(self, index):
+        return self._interval(
+            self.flags[index],
+            self.lowers[index],
+            self.uppers[index],
+            self.data_indexes[index],
+        )
+
+    def intervals(self):
+        """
+        Returns a list of all the intervals, unpacking each column at once.
+        """
+
+        return [
+            self._interval(*values)
+            for values in zip(
+                self.flags.unpack(),
+                self.lowers.unpack(),
+                self.uppers.unpack(),
+                self.data_indexes.unpack(),
+            )
+        ]
+
+
+def loads(data):
+    """
+    Creates an IntervalSet from its binary representation,
+    see :func:`dumps`.
+    """
+
+    return IntervalSet(_Layout(data).intervals(), check_overlaps=False)
+
+
+def load(path):
+    """
+    Reads an IntervalSet written by :func:`dump`.
+    """
+
+    with open(path, 'rb') as input_file:
+        return loads(input_file.read())
+
+
+class MappedIntervalSet(object):
+    """
+    A read-only interval set backed by a memory mapped file written by
+    :func:`dump`. Membership checks bisect the packed bound values in place,
+    Interval objects are only created when they are returned.
+
+    >>> import os, tempfile
+    >>> handle, path = tempfile.mkstemp()
+    >>> os.close(handle)
+    >>> dump(
+    ...     [Interval.closed(0, 5, 'a'), Interval.open_closed(5, 8, 'b'),
+    ...      Interval(Bound.gt(10), Bound.lt_inf())],
+    ...     path,
+    ... )
+
+    >>> mapped = load_mmap(path)
+    >>> len(mapped)
+    3
+    >>> [value in mapped for value in (-1, 0, 5, 6, 9, 10, 11)]
+    [False, True, True, True, False, False, True]
+    >>> mapped.find(5), mapped.find(5.5), mapped.find(9)
+    (<Interval [0, 5]: a>, <Interval (5, 8]: b>, None)
+    >>> mapped[-1]
+    <Interval (10, inf)>
+    >>> mapped.close()
+
+    It can be used as a context manager, which closes it:
+
+    >>> with load_mmap(path) as mapped:
+    ...     mapped.to_interval_set() == load(path)
+    True
+    >>> os.remove(path)
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as input_file:
+            self._mmap = mmap.mmap(
+                input_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        self._layout = _Layout(self._mmap)
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._layout.count
+
+    def __getitem__(self, index):
+        count = self._layout.count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError(index)
+        return self._layout.interval(index)
+
+    def __iter__(self):
+        for index in range(self._layout.count):
+            yield self._layout.interval(index)
+
+    def _contains_at(self, index, value):
+        layout = self._layout
+        flags = layout.flags[index]
+
+        if not flags & LOWER_INFINITE:
+            lower = layout.lowers[index]
+            if value < lower or (value == lower and not flags & LOWER_CLOSED):
+                return False
+
+        if not flags & UPPER_INFINITE:
+            upper = layout.uppers[index]
+            if value > upper or (value == upper and not flags & UPPER_CLOSED):
+                return False
+
+        return True
+
+    def _index(self, value):
+        """
+        Returns the index of the interval containing the value or None.
+        """
+
+        layout = self._layout
+        if not layout.count:
+            return None
+
+        # (-inf, inf) has no values to compare with (or take the type from)
+        infinite = LOWER_INFINITE | UPPER_INFINITE
+        if layout.flags[0] & infinite == infinite:
+            return 0
+
+        value = layout.codec.encode(value)
+        index = bisect_right(layout.lowers, value) - 1
+
+        # the previous interval can end where this one starts
+        for candidate in (index, index - 1):
+            if candidate >= 0 and self._contains_at(candidate, value):
+                return candidate
+
+        return None
+
+    def __contains__(self, value):
+        return self._index(value) is not None
+
+    def find(self, value):
+        """
+        Returns the interval (with its data) containing the value or None.
+        """
+
+        index = self._index(value)
+        return None if index is None else self._layout.interval(index)
+
+    def to_interval_set(self):
+        return IntervalSet(self._layout.intervals(), check_overlaps=False)
+
+    def __repr__(self):
+        return '<{} of {} intervals>'.format(
+            self.__class__.__name__, len(self)
+        )
+
+
+def load_mmap(path):
+    """
+    Memory maps a file written by :func:`dump` and returns
+    a :class:`MappedIntervalSet`, which can be queried without loading
+    all of the intervals.
+    """
+
+    return MappedIntervalSet(path)
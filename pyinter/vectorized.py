@@ -0,0 +1,266 @@
+"""
+NumPy implementation of the union, set_intersection and difference sweeps
+for intervals with numeric bounds and no data.
+
+All bounds are sorted at once with numpy.lexsort, the number of intervals
+covering each point of the sweep is computed with cumulative sums and the
+resulting intervals are found by masking the positions where the coverage
+changes. Python objects are only touched when creating the result.
+
+IntervalSet uses these functions automatically when NumPy is installed
+and the inputs are large enough, see :func:`accepts`.
+"""
+
+import numbers
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from .extrema import INFINITY, NEGATIVE_INFINITY
+from .interval import Interval
+
+
+# below this number of intervals the pure python sweeps are faster
+MIN_SIZE = 1024
+
+# integers above this can't be represented exactly as floats
+MAX_EXACT_INTEGER = 2 ** 53
+
+
+def _is_numeric(value):
+    """
+    Checks whether a bound value can be stored in a float64 array
+    without changing it, other real numbers (eg. Fractions) aren't
+    accepted, even if they could be compared as floats.
+    """
+
+    if value is INFINITY or value is NEGATIVE_INFINITY:
+        return True
+    if isinstance(value, numbers.Integral):
+        return -MAX_EXACT_INTEGER <= value <= MAX_EXACT_INTEGER
+    if isinstance(value, float):
+        return True
+    # eg. numpy.longdouble may be more precise than float64
+    return isinstance(value, numpy.floating) and float(value) == value
+
+
+def accepts(intervals, ignore_data=False):
+    """
+    Checks whether the intervals can (and should) be handled by
+    this module: NumPy has to be installed, there have to be at least
+    MIN_SIZE intervals and all of them need numeric bounds and no data
+    (unless ignore_data is set).
+
+    >>> accepts([Interval.closed(0, 1)] * MIN_SIZE)
+    True
+    >>> accepts([Interval.closed(0, 1)])
+    False
+    >>> accepts([Interval.closed(0, 1, 'data')] * MIN_SIZE)
+    False
+    >>> accepts([Interval.closed(0, 1, 'data')] * MIN_SIZE, ignore_data=True)
+    True
+    >>> accepts([Interval.closed('a', 'b')] * MIN_SIZE)
+    False
+
+    Fractions would lose precision in float64 arrays, so they're left
+    to the pure python sweeps:
+
+    >>> from fractions import Fraction
+    >>> from pyinter import IntervalSet, union
+    >>> values = [1 + Fraction(i, 10 ** 20) for i in range(2 * MIN_SIZE)]
+    >>> points = [Interval.closed(value, value) for value in values]
+    >>> accepts(points)
+    False
+    >>> merged = IntervalSet(points[::2]) | IntervalSet(points[1::2])
+    >>> len(list(merged)), list(merged) == union(*points)
+    (2048, True)
+    """
+
+    if numpy is None or len(intervals) < MIN_SIZE:
+        return False
+
+    for interval in intervals:
+        if interval.data and not ignore_data:
+            return False
+        if not (
+            _is_numeric(interval.lower.value)
+            and _is_numeric(interval.upper.value)
+        ):
+            return False
+
+    return True
+
+
+def _key(value):
+    if value is INFINITY:
+        return float('inf')
+    if value is NEGATIVE_INFINITY:
+        return float('-inf')
+    return value
+
+
+def _opposite_orders(orders):
+    # ) <-> [ and ] <-> (
+    return numpy.where((orders == -2) | (orders == 1), orders + 1, orders - 1)
+
+
+def _sweep(groups, inside):
+    """
+    Sorts bounds of all the interval groups and returns a list of
+    (lower, upper) bound pairs of the ranges in which inside(depths)
+    is true, where depths holds the number of intervals from each group
+    covering the position right after each bound.
+    """
+
+    bounds = []
+    group_ids = []
+    for group_id, intervals in enumerate(groups):
+        for interval in intervals:
+            bounds.append(interval.lower)
+            bounds.append(interval.upper)
+        group_ids.append(numpy.full(2 * len(intervals), group_id, 'int8'))
+
+    if not bounds:
+        return []
+
+    keys = numpy.array([_key(bound.value) for bound in bounds], 'float64')
+    orders = numpy.array([bound._order for bound in bounds], 'int8')
+    group_ids = numpy.concatenate(group_ids)
+
+    order = numpy.lexsort((orders, keys))
+    keys = keys[order]
+    orders = orders[order]
+    group_ids = group_ids[order]
+
+    is_lower = (orders == -1) | (orders == 2)
+    deltas = numpy.where(is_lower, 1, -1)
+    depths = [
+        numpy.cumsum(numpy.where(group_ids == group_id, deltas, 0))
+        for group_id in range(len(groups))
+    ]
+
+    now = inside(*depths)
+    before = numpy.concatenate(([False], now[:-1]))
+    starts = numpy.flatnonzero(now & ~before)
+    ends = numpy.flatnonzero(~now & before)
+
+    # ranges start on lower bounds or right after upper bounds
+    # and end on upper bounds or right before lower bounds
+    start_inverted = ~is_lower[starts]
+    end_inverted = is_lower[ends]
+
+    start_orders = numpy.where(
+        start_inverted, _opposite_orders(orders[starts]), orders[starts]
+    )
+    end_orders = numpy.where(
+        end_inverted, _opposite_orders(orders[ends]), orders[ends]
+    )
+    valid = (keys[starts] < keys[ends]) | (
+        (keys[starts] == keys[ends]) & (start_orders < end_orders)
+    )
+
+    pairs = []
+    for start, end, invert_start, invert_end in zip(
+        order[starts[valid]].tolist(),
+        order[ends[valid]].tolist(),
+        start_inverted[valid].tolist(),
+        end_inverted[valid].tolist(),
+    ):
+        lower = bounds[start]
+        upper = bounds[end]
+        pairs.append((
+            ~lower if invert_start else lower,
+            ~upper if invert_end else upper,
+        ))
+
+    return pairs
+
+
+def union(intervals):
+    """
+    Returns the union of intervals, like :func:`pyinter.union` with
+    ignore_data=True.
+
+    >>> union([
+    ...   Interval.closed(5, 11),
+    ...   Interval.closed(0, 3),
+    ...   Interval.closed(2, 8),
+    ...   Interval.closed_open(13, 16),
+    ...   Interval.closed(16, 24),
+    ...   Interval.open(24, 25),
+    ... ])
+    [<Interval [0, 11]>, <Interval [13, 25)>]
+
+    >>> union([Interval.closed(0, 1), Interval.closed(1, 1)])
+    [<Interval [0, 1]>]
+    >>> union([])
+    []
+    """
+
+    pairs = _sweep((intervals, ), lambda depth: depth > 0)
+
+    result = []
+    for lower, upper in pairs:
+        # join adjacent ranges, eg. [0, 1) and [1, 2]
+        if result and result[-1].upper.is_opposite_of(lower):
+            lower = result.pop().lower
+        result.append(Interval(lower, upper))
+
+    return result
+
+
+def set_intersection(*interval_sets):
+    """
+    Returns the intersection of interval sets, like
+    :func:`pyinter.set_intersection` with ignore_data=True.
+    Intervals within each of the sets must not overlap.
+
+    >>> set_intersection(
+    ... [Interval.closed(0, 3), Interval.closed(5, 8),
+    ...  Interval.closed(14, 18)],
+    ... [Interval.closed(4, 8), Interval.closed(11, 16)],
+    ... [Interval.closed(2, 17)]
+    ... )
+    [<Interval [5, 8]>, <Interval [14, 16]>]
+
+    >>> set_intersection([Interval.closed(0, 1)], [Interval.open(1, 2)])
+    []
+    """
+
+    if not interval_sets:
+        return []
+
+    count = len(interval_sets)
+    pairs = _sweep(
+        [list(interval_set) for interval_set in interval_sets],
+        lambda *depths: sum(depths) == count,
+    )
+    return [Interval(lower, upper) for lower, upper in pairs]
+
+
+def difference(base_intervals, subtracting_intervals):
+    """
+    Returns the parts of base_intervals not covered by subtracting_intervals,
+    like :func:`pyinter.difference` for base intervals without data.
+    Base intervals must not overlap.
+
+    >>> difference(
+    ...   [Interval.closed(0, 2), Interval.open(3, 5)],
+    ...   [Interval.open(1, 3), Interval.closed(4, 5)],
+    ... )
+    [<Interval [0, 1]>, <Interval (3, 4)>]
+
+    >>> difference([Interval.closed(1, 4)], [Interval.open(1, 2)])
+    [<Interval [1, 1]>, <Interval [2, 4]>]
+
+    >>> difference([Interval.open(1, 2)], [Interval.open(0, 3)])
+    []
+    """
+
+    pairs = _sweep(
+        (list(base_intervals), list(subtracting_intervals)),
+        lambda base, subtracting: (base > 0) & (subtracting == 0),
+    )
+    return [Interval(lower, upper) for lower, upper in pairs]
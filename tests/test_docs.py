@@ -1,7 +1,25 @@
-import unittest2
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
 import doctest
 
-from pyinter import bound, interval, interval_set, extrema
+from pyinter import (
+    batch,
+    bench,
+    bound,
+    compact_interval_set,
+    disk,
+    extrema,
+    instrumentation,
+    interval,
+    interval_index,
+    interval_set,
+    lazy,
+    parallel,
+    serialization,
+    vectorized,
+)
 
 
 def load_tests(loader, tests, ignore):
@@ -15,4 +33,21 @@ def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite(bound, optionflags=flags))
     tests.addTests(doctest.DocTestSuite(interval, optionflags=flags))
     tests.addTests(doctest.DocTestSuite(interval_set, optionflags=flags))
+    tests.addTests(
+        doctest.DocTestSuite(compact_interval_set, optionflags=flags)
+    )
+    tests.addTests(doctest.DocTestSuite(interval_index, optionflags=flags))
+    tests.addTests(doctest.DocTestSuite(lazy, optionflags=flags))
+    tests.addTests(doctest.DocTestSuite(batch, optionflags=flags))
+    tests.addTests(doctest.DocTestSuite(bench, optionflags=flags))
+    tests.addTests(
+        doctest.DocTestSuite(instrumentation, optionflags=flags)
+    )
+    tests.addTests(doctest.DocTestSuite(parallel, optionflags=flags))
+    tests.addTests(
+        doctest.DocTestSuite(serialization, optionflags=flags)
+    )
+    tests.addTests(doctest.DocTestSuite(disk, optionflags=flags))
+    if vectorized.numpy is not None:
+        tests.addTests(doctest.DocTestSuite(vectorized, optionflags=flags))
     return tests
@@ -1,8 +1,12 @@
 import random
 import time
-import unittest2
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
 
-from pyinter import Interval
+from pyinter import Interval, IntervalSet
+from pyinter.batch import intersect_pairs, union_pairs
 
 
 def timeit(method):
@@ -18,7 +22,7 @@ def timeit(method):
     return timed
 
 
-class TestPerformance(unittest2.TestCase):
+class TestPerformance(unittest.TestCase):
 
     def setUp(self):
         self.intervals = []
@@ -45,6 +49,16 @@ class TestPerformance(unittest2.TestCase):
             for a, b in pairs:
                 a | b
 
+    @timeit
+    def test_and_batch(self):
+        for i in range(10):
+            intersect_pairs(self.intervals[0::2], self.intervals[1::2])
+
+    @timeit
+    def test_or_batch(self):
+        for i in range(10):
+            union_pairs(self.intervals[0::2], self.intervals[1::2])
+
     @timeit
     def test_or_grouped(self):
         queue = list(self.intervals)
@@ -65,6 +79,15 @@ class TestPerformance(unittest2.TestCase):
             for a, b in pairs:
                 queue.append(a & b)
 
+    @timeit
+    def test_measure_between(self):
+        interval_set = IntervalSet(
+            Interval.closed(value, value + 1) for value in range(0, 20000, 2)
+        )
+        for i in range(10000):
+            lower = random.randint(0, 20000)
+            interval_set.measure_between(lower, lower + 100)
+
 if __name__ == '__main__':
     test_or = TestPerformance('test_or')
     test_or.setUp()